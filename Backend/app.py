@@ -5,65 +5,327 @@ This module provides the REST API endpoints for the Finance Tracker application.
 The database schema should be initialized separately using scripts/init_db.py.
 """
 
-import os
 from datetime import datetime
-from flask import Flask, request, jsonify
+from decimal import Decimal
+from flask import g, request, jsonify, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
 from flask_cors import CORS
 import argparse
+import hashlib
+import msgpack
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
 
+from app_factory import make_app
 from services.models import db
 from services.db_service import DatabaseService
+from utils.serializers import compile_list_encoder, dump_transaction_models
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider backed by orjson.
+
+    orjson serializes to UTF-8 bytes in C, which is significantly faster
+    than the stdlib json module for the large list responses returned by
+    the transaction/budget endpoints.
+    """
+
+    @staticmethod
+    def _default(obj):
+        """Fallback for types orjson doesn't handle natively."""
+        if isinstance(obj, Decimal):
+            return float(obj)
+        if hasattr(obj, 'to_dict'):
+            return obj.to_dict()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(
+            obj, default=self._default, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        # Skip the bytes -> str -> bytes round trip of the default provider
+        return self._app.response_class(
+            orjson.dumps(obj, default=self._default, option=orjson.OPT_NON_STR_KEYS),
+            mimetype='application/json'
+        )
+
 
 # Create Flask application
-app = Flask(__name__)
+app = make_app()
+app.json = OrjsonProvider(app)
 # Replace this line:
 # CORS(app)  # Enable CORS for all routes
 
 # With this more specific configuration:
 CORS(app, resources={r"/api/*": {"origins": ["http://localhost:8080"]}})
 
-# Configure SQLite database
-basedir = os.path.abspath(os.path.dirname(__file__))
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + os.path.join(basedir, 'finance.db')
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# Compress large JSON responses (brotli preferred, gzip fallback).
+# List endpoints grow linearly with row count and typical JSON
+# compresses 5-10x, so this mostly pays off on the wire.
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 1024
+app.config['COMPRESS_LEVEL'] = 4
+Compress(app)
+
+
+@app.before_request
+def _init_request_cache():
+    """Set up per-request state: the entity cache and the request clock."""
+    g._entity_cache = {}
+    # One clock read per request; handlers needing "now" share this.
+    g.now = datetime.now()
+
+
+def _cached_get(kind, entity_id, loader):
+    """
+    Look up an entity through the per-request cache.
+
+    Repeated lookups for the same (kind, id) within one request collapse
+    to a single database round trip.
+    """
+    key = (kind, entity_id)
+    cache = g._entity_cache
+    if key not in cache:
+        cache[key] = loader(entity_id)
+    return cache[key]
+
+
+def _invalidate_cached(kind, entity_id):
+    """Drop a cached entity after a mutation so later reads refetch it."""
+    g._entity_cache.pop((kind, entity_id), None)
+
+
+def _page_args():
+    """Parse the optional limit/offset pagination query parameters."""
+    return request.args.get('limit', type=int), request.args.get('offset', type=int)
+
+
+def _filter_fields(objs):
+    """
+    Apply the optional ?fields= projection to a list of model objects.
+
+    Clients that only need a few columns (e.g. fields=id,amount) avoid
+    paying serialization and transfer cost for the rest.
+    """
+    fields = request.args.get('fields')
+    if not fields:
+        return objs
+    wanted = {f.strip() for f in fields.split(',') if f.strip()}
+    return [
+        {k: v for k, v in (obj if isinstance(obj, dict) else obj.to_dict()).items() if k in wanted}
+        for obj in objs
+    ]
+
+
+# Version counter per collection, bumped on every mutation. ETags derive
+# from these, so a repeat GET with If-None-Match can be answered 304
+# without querying or serializing anything. Counters are process-local;
+# a restart just costs each client one full response.
+_collection_versions = {
+    'transactions': 0,
+    'budgets': 0,
+    'savings_goals': 0,
+    'merchant_mappings': 0,
+}
+
 
-# Initialize the database with our app (doesn't create tables)
-DatabaseService.initialize_app(app)
+def _bump_versions(*collections):
+    """Record a mutation against the given collections."""
+    for collection in collections:
+        _collection_versions[collection] += 1
+
+
+def _collection_etag(*collections):
+    """Compute the current ETag for one or more collections."""
+    token = ';'.join(f"{c}:{_collection_versions[c]}" for c in collections)
+    return hashlib.blake2b(token.encode(), digest_size=8).hexdigest()
+
+
+def _conditional_json(data_fn, *collections):
+    """
+    Answer a GET conditionally based on collection versions.
+
+    If the client's If-None-Match matches the current ETag, return 304
+    without running the query or serializing; otherwise build the
+    response from data_fn() and tag it. The negotiated media type is
+    part of the ETag: the JSON and msgpack bodies of one URI are
+    different representations and must not validate against each other.
+    """
+    etag = _collection_etag(*collections)
+    if _wants_msgpack():
+        etag += '-mp'
+    if etag in request.if_none_match:
+        response = app.response_class(status=304)
+        response.headers['Vary'] = 'Accept'
+        return response
+    response = _json(data_fn())
+    response.set_etag(etag)
+    return response
+
+
+def _wants_msgpack():
+    """True when the client prefers application/msgpack over JSON."""
+    best = request.accept_mimetypes.best_match(
+        ['application/json', 'application/msgpack'])
+    return best == 'application/msgpack'
+
+
+def _msgpack_default(obj):
+    """msgpack fallback: isoformat datetimes, then the shared default."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return OrjsonProvider._default(obj)
+
+
+def _json(data, status=200):
+    """
+    Build a response directly from data, including model objects.
+
+    Model instances (and lists of them) are serialized by orjson through
+    the provider's default hook, so handlers don't need to build an
+    intermediate list of dicts just to throw it away after encoding.
+    Clients sending Accept: application/msgpack get the same data as
+    MessagePack, which encodes faster and smaller than JSON.
+    """
+    if not isinstance(data, bytes) and _wants_msgpack():
+        response = app.response_class(
+            msgpack.packb(data, default=_msgpack_default),
+            status=status,
+            mimetype='application/msgpack'
+        )
+    else:
+        if not isinstance(data, bytes):
+            data = orjson.dumps(data, default=OrjsonProvider._default, option=orjson.OPT_NON_STR_KEYS)
+        response = app.response_class(data, status=status, mimetype='application/json')
+    # The body depends on Accept; shared caches must key on it
+    response.headers['Vary'] = 'Accept'
+    return response
+
+
+def _stream_transactions():
+    """
+    Stream the transaction list as chunked JSON.
+
+    The first bytes leave before the last row is read, and peak memory
+    stays constant instead of growing with the result size.
+    """
+    def generate():
+        yield b'['
+        first = True
+        for row in DatabaseService.iter_all_transactions_raw():
+            yield orjson.dumps(row) if first else b',' + orjson.dumps(row)
+            first = False
+        yield b']'
+
+    return app.response_class(stream_with_context(generate()), mimetype='application/json')
+
+
+# Precompiled list encoders: one straight-line encoder per response
+# schema, with the key bytes baked in at compile time.
+_encode_transaction_list = compile_list_encoder(
+    ('id', 'amount', 'description', 'comments', 'tags', 'category', 'type', 'date'))
+_encode_budget_list = compile_list_encoder(
+    ('id', 'category', 'amount', 'spent', 'month', 'year', 'recurring', 'period'))
 
 
 # Routes for transactions
 @app.route('/api/transactions', methods=['GET'])
 def get_transactions():
-    """Get all transactions."""
-    transactions = DatabaseService.get_all_transactions()
-    return jsonify([transaction.to_dict() for transaction in transactions])
+    """
+    Get all transactions.
+
+    Query parameters:
+    - limit/offset: Optional pagination window
+    - after_date/after_id: Keyset cursor (the date and id of the last row
+      seen); returns the next page ordered by date desc, id desc
+    - fields: Optional comma-separated list of fields to return
+    - stream: If set, stream the response with chunked transfer encoding
+    """
+    if request.args.get('stream'):
+        return _stream_transactions()
+
+    if request.args.get('after_id'):
+        page = DatabaseService.get_transactions_page(
+            last_date=datetime.fromisoformat(request.args['after_date']),
+            last_id=request.args['after_id'],
+            limit=request.args.get('limit', default=100, type=int)
+        )
+        return _json(_filter_fields(page)) if request.args.get('fields') or _wants_msgpack() \
+            else _json(_encode_transaction_list(page))
+
+    limit, offset = _page_args()
+    if request.args.get('fields') or _wants_msgpack():
+        return _conditional_json(
+            lambda: _filter_fields(DatabaseService.get_all_transactions_raw(limit=limit, offset=offset)),
+            'transactions'
+        )
+    return _conditional_json(
+        lambda: _encode_transaction_list(DatabaseService.get_all_transactions_raw(limit=limit, offset=offset)),
+        'transactions'
+    )
 
 
 @app.route('/api/transactions/<transaction_id>', methods=['GET'])
 def get_transaction(transaction_id):
     """Get a transaction by ID."""
-    transaction = DatabaseService.get_transaction_by_id(transaction_id)
+    transaction = _cached_get('transaction', transaction_id, DatabaseService.get_transaction_by_id)
     if not transaction:
         return jsonify({"error": "Transaction not found"}), 404
-    return jsonify(transaction.to_dict())
+    return _json(transaction)
 
 
 @app.route('/api/transactions', methods=['POST'])
 def create_transaction():
     """Create a new transaction."""
-    data = request.json
+    data = request.get_json(cache=False)
     transaction = DatabaseService.create_transaction(data)
-    return jsonify(transaction.to_dict()), 201
+    _bump_versions('transactions', 'budgets')
+    return _json(transaction, 201)
+
+
+@app.route('/api/transactions/batch', methods=['POST'])
+def create_transactions_batch():
+    """
+    Create multiple transactions in one commit.
+
+    Accepts a JSON array of transaction objects. All rows share a single
+    database transaction, so the per-commit fsync cost is amortized over
+    the batch. Recommended batch size is 100-1000 items.
+    """
+    items = request.get_json(cache=False)
+    if not isinstance(items, list):
+        return jsonify({"error": "Expected a JSON array of transactions"}), 400
+    transactions = DatabaseService.create_transactions(items)
+    _bump_versions('transactions', 'budgets')
+    if _wants_msgpack():
+        return _json(transactions, 201)
+    # Render the whole list inside pydantic's compiled core instead of
+    # calling to_dict per object and re-walking the dicts in orjson
+    return _json(dump_transaction_models(transactions), 201)
 
 
 @app.route('/api/transactions/<transaction_id>', methods=['PUT'])
 def update_transaction(transaction_id):
     """Update an existing transaction."""
-    data = request.json
-    transaction = DatabaseService.update_transaction(transaction_id, data)
+    data = request.get_json(cache=False)
+    transaction, changed = DatabaseService.update_transaction(transaction_id, data)
     if not transaction:
         return jsonify({"error": "Transaction not found"}), 404
-    return jsonify(transaction.to_dict())
+    # Only a confirmed mutation invalidates caches and ETags; a 404 or
+    # no-op PUT leaves every client's cached state valid
+    if changed:
+        _invalidate_cached('transaction', transaction_id)
+        _bump_versions('transactions', 'budgets')
+    return _json(transaction)
 
 
 @app.route('/api/transactions/<transaction_id>', methods=['DELETE'])
@@ -72,6 +334,8 @@ def delete_transaction(transaction_id):
     success = DatabaseService.delete_transaction(transaction_id)
     if not success:
         return jsonify({"error": "Transaction not found"}), 404
+    _invalidate_cached('transaction', transaction_id)
+    _bump_versions('transactions', 'budgets')
     return '', 204
 
 
@@ -84,24 +348,38 @@ def get_budgets():
     Query parameters:
     - month: Optional month (1-12)
     - year: Optional year
+    - limit/offset: Optional pagination window
+    - fields: Optional comma-separated list of fields to return
     """
     month = request.args.get('month', type=int)
     year = request.args.get('year', type=int)
 
     # If month is provided but year is not, use current year
     if month is not None and year is None:
-        year = datetime.now().year
-
-    budgets = DatabaseService.get_all_budgets(month, year)
-    return jsonify([budget.to_dict() for budget in budgets])
+        year = g.now.year
+
+    limit, offset = _page_args()
+    if request.args.get('fields') or _wants_msgpack():
+        return _conditional_json(
+            lambda: _filter_fields(DatabaseService.get_all_budgets_raw(month, year, limit=limit, offset=offset)),
+            'budgets'
+        )
+    return _conditional_json(
+        lambda: _encode_budget_list(DatabaseService.get_all_budgets_raw(month, year, limit=limit, offset=offset)),
+        'budgets'
+    )
 
 
 @app.route('/api/budgets/current', methods=['GET'])
 def get_current_budgets():
     """Get budgets for the current month and year."""
-    today = datetime.now()
-    budgets = DatabaseService.get_all_budgets(today.month, today.year)
-    return jsonify([budget.to_dict() for budget in budgets])
+    return get_budgets_by_period(g.now.year, g.now.month)
+
+
+# Encoded budget payload per (year, month, version); both the period and
+# current-month endpoints serve from it, and any budget mutation makes
+# the version component stale.
+_budget_period_cache = {}
 
 
 @app.route('/api/budgets/period/<int:year>/<int:month>', methods=['GET'])
@@ -110,35 +388,61 @@ def get_budgets_by_period(year, month):
     if month < 1 or month > 12:
         return jsonify({"error": "Invalid month. Must be between 1 and 12."}), 400
 
-    budgets = DatabaseService.get_all_budgets(month, year)
-    return jsonify([budget.to_dict() for budget in budgets])
+    def encoded_period():
+        if _wants_msgpack():
+            return DatabaseService.get_all_budgets_raw(month, year)
+        key = (year, month, _collection_versions['budgets'])
+        body = _budget_period_cache.get(key)
+        if body is None:
+            if len(_budget_period_cache) >= 64:
+                _budget_period_cache.clear()
+            body = _encode_budget_list(DatabaseService.get_all_budgets_raw(month, year))
+            _budget_period_cache[key] = body
+        return body
+
+    return _conditional_json(encoded_period, 'budgets')
 
 
 @app.route('/api/budgets/<budget_id>', methods=['GET'])
 def get_budget(budget_id):
     """Get a budget by ID."""
-    budget = DatabaseService.get_budget_by_id(budget_id)
+    budget = _cached_get('budget', budget_id, DatabaseService.get_budget_by_id)
     if not budget:
         return jsonify({"error": "Budget not found"}), 404
-    return jsonify(budget.to_dict())
+    return _json(budget)
 
 
 @app.route('/api/budgets', methods=['POST'])
 def create_budget():
     """Create a new budget."""
-    data = request.json
+    data = request.get_json(cache=False)
     budget = DatabaseService.create_budget(data)
-    return jsonify(budget.to_dict()), 201
+    _bump_versions('budgets')
+    return _json(budget, 201)
+
+
+@app.route('/api/budgets/batch', methods=['POST'])
+def create_budgets_batch():
+    """Create multiple budgets in one commit."""
+    items = request.get_json(cache=False)
+    if not isinstance(items, list):
+        return jsonify({"error": "Expected a JSON array of budgets"}), 400
+    budgets = DatabaseService.create_budgets(items)
+    _bump_versions('budgets')
+    return _json(budgets, 201)
 
 
 @app.route('/api/budgets/<budget_id>', methods=['PUT'])
 def update_budget(budget_id):
     """Update an existing budget."""
-    data = request.json
-    budget = DatabaseService.update_budget(budget_id, data)
+    data = request.get_json(cache=False)
+    budget, changed = DatabaseService.update_budget(budget_id, data)
     if not budget:
         return jsonify({"error": "Budget not found"}), 404
-    return jsonify(budget.to_dict())
+    if changed:
+        _invalidate_cached('budget', budget_id)
+        _bump_versions('budgets')
+    return _json(budget)
 
 
 @app.route('/api/budgets/<budget_id>', methods=['DELETE'])
@@ -147,52 +451,102 @@ def delete_budget(budget_id):
     success = DatabaseService.delete_budget(budget_id)
     if not success:
         return jsonify({"error": "Budget not found"}), 404
+    _invalidate_cached('budget', budget_id)
+    _bump_versions('budgets')
     return '', 204
 
 
+# Single background worker for deferred jobs; rollover inserts are
+# serialized behind one writer so clients never block on their fsyncs.
+_background_executor = ThreadPoolExecutor(max_workers=1)
+_background_jobs = {}
+
+
+def _run_create_next_month_budgets(job_id):
+    """Background job: create next month's budgets and record the outcome."""
+    with app.app_context():
+        try:
+            new_budgets = DatabaseService.create_next_month_budgets()
+            _bump_versions('budgets')
+            _background_jobs[job_id] = {
+                "status": "done",
+                "message": f"Created {len(new_budgets)} budgets for next month",
+                "budgets": [budget.to_dict() for budget in new_budgets]
+            }
+        except Exception as exc:
+            db.session.rollback()
+            _background_jobs[job_id] = {"status": "failed", "error": str(exc)}
+
+
 @app.route('/api/budgets/create-next-month', methods=['POST'])
 def create_next_month_budgets():
-    """Create budgets for the next month based on recurring budgets from the current month."""
-    new_budgets = DatabaseService.create_next_month_budgets()
-    return jsonify({
-        "message": f"Created {len(new_budgets)} budgets for next month",
-        "budgets": [budget.to_dict() for budget in new_budgets]
-    }), 201
+    """
+    Create budgets for the next month based on recurring budgets from the
+    current month.
+
+    The work runs on a background worker; the response is 202 Accepted
+    with a job id to poll, so the client doesn't block on the inserts.
+    """
+    job_id = uuid4().hex
+    _background_jobs[job_id] = {"status": "pending"}
+    _background_executor.submit(_run_create_next_month_budgets, job_id)
+    return _json({"job_id": job_id, "status": "pending"}, 202)
+
+
+@app.route('/api/budgets/create-next-month/<job_id>', methods=['GET'])
+def get_create_next_month_budgets_job(job_id):
+    """Poll the status of a create-next-month job."""
+    job = _background_jobs.get(job_id)
+    if not job:
+        return jsonify({"error": "Job not found"}), 404
+    return _json(job)
 
 
 # Routes for savings goals
 @app.route('/api/savings-goals', methods=['GET'])
 def get_savings_goals():
-    """Get all savings goals."""
-    goals = DatabaseService.get_all_savings_goals()
-    return jsonify([goal.to_dict() for goal in goals])
+    """
+    Get all savings goals.
+
+    Query parameters:
+    - limit/offset: Optional pagination window
+    - fields: Optional comma-separated list of fields to return
+    """
+    limit, offset = _page_args()
+    return _conditional_json(
+        lambda: _filter_fields(DatabaseService.get_all_savings_goals(limit=limit, offset=offset)),
+        'savings_goals'
+    )
 
 
 @app.route('/api/savings-goals/<goal_id>', methods=['GET'])
 def get_savings_goal(goal_id):
     """Get a savings goal by ID."""
-    goal = DatabaseService.get_savings_goal_by_id(goal_id)
+    goal = _cached_get('savings_goal', goal_id, DatabaseService.get_savings_goal_by_id)
     if not goal:
         return jsonify({"error": "Savings goal not found"}), 404
-    return jsonify(goal.to_dict())
+    return _json(goal)
 
 
 @app.route('/api/savings-goals', methods=['POST'])
 def create_savings_goal():
     """Create a new savings goal."""
-    data = request.json
+    data = request.get_json(cache=False)
     goal = DatabaseService.create_savings_goal(data)
-    return jsonify(goal.to_dict()), 201
+    _bump_versions('savings_goals')
+    return _json(goal, 201)
 
 
 @app.route('/api/savings-goals/<goal_id>', methods=['PUT'])
 def update_savings_goal(goal_id):
     """Update an existing savings goal."""
-    data = request.json
+    data = request.get_json(cache=False)
     goal, transaction = DatabaseService.update_savings_goal(goal_id, data)
     if not goal:
         return jsonify({"error": "Savings goal not found"}), 404
-    return jsonify(goal.to_dict())
+    _invalidate_cached('savings_goal', goal_id)
+    _bump_versions('savings_goals', 'transactions')
+    return _json(goal)
 
 
 @app.route('/api/savings-goals/<goal_id>', methods=['DELETE'])
@@ -201,15 +555,31 @@ def delete_savings_goal(goal_id):
     success, _ = DatabaseService.delete_savings_goal(goal_id)
     if not success:
         return jsonify({"error": "Savings goal not found"}), 404
+    _invalidate_cached('savings_goal', goal_id)
+    _bump_versions('savings_goals', 'transactions')
     return '', 204
 
 
 # Routes for merchant mappings
+# Merchant mappings change rarely, so keep the encoded payload around
+# until the collection version moves.
+_merchant_mappings_payload = {'version': None, 'body': None}
+
+
 @app.route('/api/merchant-mappings', methods=['GET'])
 def get_merchant_mappings():
     """Get all merchant mappings."""
-    mappings = DatabaseService.get_all_merchant_mappings()
-    return jsonify(mappings)
+    def payload():
+        if _wants_msgpack():
+            return DatabaseService.get_all_merchant_mappings()
+        version = _collection_versions['merchant_mappings']
+        if _merchant_mappings_payload['version'] != version:
+            _merchant_mappings_payload['body'] = orjson.dumps(
+                DatabaseService.get_all_merchant_mappings())
+            _merchant_mappings_payload['version'] = version
+        return _merchant_mappings_payload['body']
+
+    return _conditional_json(payload, 'merchant_mappings')
 
 
 @app.route('/api/merchant-mappings/<raw_name>', methods=['GET'])
@@ -218,17 +588,34 @@ def get_merchant_mapping(raw_name):
     mapping = DatabaseService.get_merchant_mapping_by_raw_name(raw_name)
     if not mapping:
         return jsonify({"error": "Merchant mapping not found"}), 404
-    return jsonify(mapping.to_dict())
+    return _json(mapping)
 
 
 @app.route('/api/merchant-mappings', methods=['POST'])
 def create_merchant_mapping():
     """Create a new merchant mapping."""
-    data = request.json
+    data = request.get_json(cache=False)
     mapping = DatabaseService.add_merchant_mapping(
         data['raw_name'], data['display_name'], data['category']
     )
-    return jsonify(mapping.to_dict()), 201
+    _bump_versions('merchant_mappings')
+    return _json(mapping, 201)
+
+
+@app.route('/api/merchant-mappings/batch', methods=['POST'])
+def create_merchant_mappings_batch():
+    """
+    Create or update multiple merchant mappings in one commit.
+
+    Accepts the same raw_name -> {"display_name", "category"} dictionary
+    shape that GET /api/merchant-mappings returns.
+    """
+    data = request.get_json(cache=False)
+    if not isinstance(data, dict):
+        return jsonify({"error": "Expected a JSON object of merchant mappings"}), 400
+    mappings = DatabaseService.add_merchant_mappings(data)
+    _bump_versions('merchant_mappings')
+    return _json(mappings, 201)
 
 
 @app.route('/api/merchant-mappings/<raw_name>', methods=['DELETE'])
@@ -237,6 +624,7 @@ def delete_merchant_mapping(raw_name):
     success = DatabaseService.delete_merchant_mapping(raw_name)
     if not success:
         return jsonify({"error": "Merchant mapping not found"}), 404
+    _bump_versions('merchant_mappings')
     return '', 204
 
 
@@ -244,8 +632,10 @@ def delete_merchant_mapping(raw_name):
 @app.route('/api/summary', methods=['GET'])
 def get_summary():
     """Get a summary of financial data."""
-    summary = DatabaseService.get_financial_summary()
-    return jsonify(summary)
+    return _conditional_json(
+        DatabaseService.get_financial_summary,
+        'transactions', 'savings_goals'
+    )
 
 
 # Seed data endpoint (for development)
@@ -253,7 +643,8 @@ def get_summary():
 def seed_data():
     """Seed the database with sample data."""
     result = DatabaseService.seed_data()
-    return jsonify({"message": "Sample data seeded successfully", "counts": result})
+    _bump_versions('transactions', 'budgets', 'savings_goals', 'merchant_mappings')
+    return _json({"message": "Sample data seeded successfully", "counts": result})
 
 
 if __name__ == '__main__':
@@ -0,0 +1,42 @@
+"""
+Application factory for the Finance Tracker backend.
+
+The API server and the maintenance scripts all need a Flask app bound to
+the finance database. Building it in one place means every entrypoint gets
+the same database tuning instead of drifting copies.
+"""
+
+import os
+
+from flask import Flask
+
+from services.db_service import DatabaseService
+
+basedir = os.path.abspath(os.path.dirname(__file__))
+
+
+def make_app(db_path=None):
+    """
+    Create a Flask app configured for the finance database.
+
+    Args:
+        db_path: Optional custom path for the database file
+
+    Returns:
+        Flask application with the database initialized (tables are not
+        created; use scripts/init_db.py for that)
+    """
+    app = Flask(__name__)
+
+    if db_path:
+        # Use provided database path
+        app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
+    else:
+        # Use default database path
+        app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + os.path.join(basedir, 'finance.db')
+
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+    # Engine pool configuration lives in DatabaseService.initialize_app
+    DatabaseService.initialize_app(app)
+    return app
@@ -8,12 +8,13 @@ to automatically create budget entries for the next month based on recurring bud
 import os
 import sys
 import argparse
+from calendar import month_name as MONTH_NAMES
 from datetime import datetime
-from flask import Flask
 
 # Add parent directory to path to import from services
 sys.path.append(os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
 
+from app_factory import make_app
 from services.models import db
 from services.db_service import DatabaseService
 
@@ -28,24 +29,9 @@ def create_next_month_budgets(db_path=None):
     Returns:
         List of newly created Budget objects
     """
-    # Create a Flask app just for DB operations
-    app = Flask(__name__)
-    
-    # Configure SQLite database
-    basedir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
-    
-    if db_path:
-        # Use provided database path
-        app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
-    else:
-        # Use default database path
-        app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + os.path.join(basedir, 'finance.db')
-        
-    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-    
-    # Initialize with database
-    DatabaseService.initialize_app(app)
-    
+    # Build the shared app configured for the finance database
+    app = make_app(db_path)
+
     # Create next month's budgets
     with app.app_context():
         new_budgets = DatabaseService.create_next_month_budgets()
@@ -55,16 +41,12 @@ def create_next_month_budgets(db_path=None):
         current_month = today.month
         current_year = today.year
         
-        next_month = current_month + 1 if current_month < 12 else 1
-        next_year = current_year if next_month > 1 else current_year + 1
-        
-        # Convert month numbers to names for better output
-        month_names = [
-            "January", "February", "March", "April", "May", "June",
-            "July", "August", "September", "October", "November", "December"
-        ]
-        current_month_name = month_names[current_month - 1]
-        next_month_name = month_names[next_month - 1]
+        next_month = (current_month % 12) + 1
+        next_year = current_year + (current_month // 12)
+
+        # calendar.month_name is 1-indexed, so month numbers map directly
+        current_month_name = MONTH_NAMES[current_month]
+        next_month_name = MONTH_NAMES[next_month]
         
         if new_budgets:
             print(f"Successfully created {len(new_budgets)} budget entries for {next_month_name} {next_year}")
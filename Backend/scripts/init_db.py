@@ -8,7 +8,13 @@ It should be run once to create the database, not on every application startup.
 import os
 import sys
 import argparse
-from flask import Flask
+
+# Add parent directory to path to import from the backend package
+sys.path.append(os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from sqlalchemy import inspect
+
+from app_factory import make_app
 from services.models import db
 from services.db_service import DatabaseService
 
@@ -24,28 +30,19 @@ def init_db(seed=False, db_path=None):
     Returns:
         None
     """
-    # Create a Flask app just for DB initialization
-    app = Flask(__name__)
-    
-    # Configure SQLite database
-    basedir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
-    
-    if db_path:
-        # Use provided database path
-        app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
-    else:
-        # Use default database path
-        app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + os.path.join(basedir, 'finance.db')
-        
-    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-    
-    # Initialize with database
-    DatabaseService.initialize_app(app)
-    
+    # Build the shared app configured for the finance database
+    app = make_app(db_path)
+
     # Create tables
     with app.app_context():
-        db.create_all()
-        print("Database tables created successfully.")
+        # Skip DDL (and its per-model PRAGMA table_info round trips) when
+        # the schema is already in place from a previous run
+        if inspect(db.engine).has_table('transactions'):
+            print("Database tables already exist, skipping creation.")
+        else:
+            db.create_all()
+            print("Database tables created successfully.")
+
         
         if seed:
             # Seed the database with sample data
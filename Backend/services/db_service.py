@@ -4,8 +4,66 @@ Database service for the Finance Tracker application.
 This module provides a service layer for database operations,
 centralizing all database access in one place.
 """
+import os
+import sqlite3
+import sys
 from datetime import datetime
-from .models import db, Transaction, Budget, SavingsGoal, MerchantMapping, generate_id
+
+try:
+    # C parser, accepts trailing 'Z' directly; ~20x faster than stdlib
+    from ciso8601 import parse_datetime as _parse_dt
+except ImportError:  # pragma: no cover - stdlib fallback
+    def _parse_dt(value):
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+from sqlalchemy import bindparam, case, delete, event, func, insert, literal, select, tuple_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import raiseload
+
+from .models import (db, generate_ids, Transaction, Budget, SavingsGoal,
+                     MerchantMapping)
+
+
+@event.listens_for(Engine, 'connect')
+def _set_sqlite_pragmas(dbapi_conn, connection_record):
+    """
+    Tune each new SQLite connection for concurrent reads.
+
+    WAL journaling lets GET handlers read while a writer commits, and
+    synchronous=NORMAL drops one fsync per commit (safe under WAL).
+    """
+    if not isinstance(dbapi_conn, sqlite3.Connection):
+        return
+    cursor = dbapi_conn.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA mmap_size=268435456')
+    cursor.execute('PRAGMA cache_size=-65536')
+    cursor.close()
+
+
+# Statement for the per-mutation hot path, built once at import time.
+# A constant statement object makes SQLAlchemy's compiled-statement cache
+# hit on identity instead of re-hashing the expression tree per call.
+# Primary-key lookups use db.session.get instead, which consults the
+# identity map before touching SQL at all.
+_BUDGET_BY_PERIOD_STMT = select(Budget).where(
+    Budget.category == bindparam('category'),
+    Budget.month == bindparam('month'),
+    Budget.year == bindparam('year'))
+
+# Monotonic counter bumped by every merchant-mapping write. The merchant
+# service folds it into its automaton/trie cache key, so value-only
+# edits (same raw_name, new display name or category) invalidate the
+# cached match structures even though the key set is unchanged.
+_merchant_mappings_version = 0
+
+
+def _bump_merchant_mappings_version():
+    global _merchant_mappings_version
+    _merchant_mappings_version += 1
 
 
 class DatabaseService:
@@ -18,46 +76,193 @@ class DatabaseService:
     def initialize_app(app):
         """
         Initialize the Flask app with the database.
-        
+
+        Configures the engine pool before binding: a sized pool with
+        overflow and pre-ping avoids both per-request connection setup
+        and stale-connection errors under load. Pool knobs can be tuned
+        per deployment through DB_POOL_* environment variables.
+
         Args:
             app: Flask application instance
         """
+        app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', {
+            'pool_size': int(os.environ.get('DB_POOL_SIZE', 10)),
+            'max_overflow': int(os.environ.get('DB_POOL_MAX_OVERFLOW', 20)),
+            'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', 30)),
+            'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', 1800)),
+            'pool_pre_ping': True,
+            # SQLite: let pooled connections hop threads; they are only
+            # ever used by one thread at a time via the pool
+            'connect_args': {'check_same_thread': False, 'timeout': 30},
+        })
         db.init_app(app)
 
+    @staticmethod
+    def _finalize(commit):
+        """
+        End a mutating method: commit by default, or only flush so a
+        caller composing several mutations pays one commit at the end.
+        """
+        if commit:
+            db.session.commit()
+        else:
+            db.session.flush()
+
     # Transaction methods
     @staticmethod
-    def get_all_transactions():
-        """Get all transactions ordered by date descending."""
-        return Transaction.query.order_by(Transaction.date.desc()).all()
+    def get_all_transactions(limit=None, offset=None):
+        """
+        Get all transactions ordered by date descending.
+
+        Args:
+            limit: Optional maximum number of rows to return
+            offset: Optional number of rows to skip
+
+        Returns:
+            List of Transaction objects
+        """
+        # No relationships exist today; raiseload keeps it that way by
+        # erroring loudly if a future one is lazy-loaded per row (N+1)
+        query = Transaction.query.options(raiseload('*')).order_by(Transaction.date.desc())
+        if offset is not None:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
     
+    @staticmethod
+    def get_all_transactions_raw(limit=None, offset=None):
+        """
+        Get all transactions as plain dicts, bypassing ORM instantiation.
+
+        Read-only endpoints only serialize and drop each row, so the
+        identity map, attribute instrumentation, and change tracking of a
+        full ORM load are wasted work. Core row mapping skips all of it.
+
+        Args:
+            limit: Optional maximum number of rows to return
+            offset: Optional number of rows to skip
+
+        Returns:
+            List of dicts shaped like Transaction.to_dict()
+        """
+        stmt = DatabaseService._transaction_select()
+        if offset is not None:
+            stmt = stmt.offset(offset)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        return [DatabaseService._transaction_row_to_dict(row)
+                for row in db.session.execute(stmt)]
+
+    @staticmethod
+    def _transaction_select():
+        """Core select for the transaction response columns, newest first."""
+        return select(
+            Transaction.id, Transaction.amount, Transaction.description,
+            Transaction.comments, Transaction.tags,
+            Transaction.category, Transaction.type, Transaction.date
+        ).order_by(Transaction.date.desc())
+
+    @staticmethod
+    def _transaction_row_to_dict(row):
+        """Map a Core transaction row to the Transaction.to_dict() shape."""
+        return {
+            'id': row.id,
+            'amount': row.amount,
+            'description': row.description,
+            'comments': row.comments,
+            'tags': row.tags or [],
+            'category': row.category,
+            'type': row.type,
+            # Raw datetime: orjson (and the msgpack default hook) render
+            # it as ISO-8601 in C, faster than Python-level isoformat
+            'date': row.date,
+        }
+
+    @staticmethod
+    def get_transactions_page(last_date=None, last_id=None, limit=100):
+        """
+        Get one keyset-paginated page of transactions as plain dicts.
+
+        Unlike OFFSET pagination, the (date, id) cursor costs O(page)
+        however deep the client scrolls: the composite index seeks
+        straight to the cursor row instead of scanning past skipped rows.
+
+        Args:
+            last_date: Date of the last row on the previous page
+            last_id: Id of the last row on the previous page
+            limit: Page size
+
+        Returns:
+            List of dicts shaped like Transaction.to_dict()
+        """
+        stmt = DatabaseService._transaction_select()
+        if last_date is not None:
+            stmt = stmt.where(
+                tuple_(Transaction.date, Transaction.id) < (last_date, last_id)
+            )
+        stmt = stmt.order_by(None).order_by(
+            Transaction.date.desc(), Transaction.id.desc()
+        ).limit(limit)
+
+        return [DatabaseService._transaction_row_to_dict(row)
+                for row in db.session.execute(stmt)]
+
+    @staticmethod
+    def iter_all_transactions_raw(batch_size=500):
+        """
+        Stream all transactions as plain dicts, newest first.
+
+        The yield_per execution option keeps the driver's buffer bounded
+        to batch_size rows, so callers can serialize arbitrarily large
+        result sets in constant memory.
+
+        Args:
+            batch_size: Number of rows to buffer per fetch
+
+        Yields:
+            Dicts shaped like Transaction.to_dict()
+        """
+        stmt = DatabaseService._transaction_select().execution_options(yield_per=batch_size)
+        for row in db.session.execute(stmt):
+            yield DatabaseService._transaction_row_to_dict(row)
+
     @staticmethod
     def get_transaction_by_id(transaction_id):
         """Get a transaction by ID."""
-        return Transaction.query.get(transaction_id)
+        return db.session.get(Transaction, transaction_id)
     
     @staticmethod
-    def create_transaction(data):
+    def _build_transaction(data):
         """
-        Create a new transaction.
-        
+        Construct a Transaction from request data and stage it on the
+        session, applying its budget impact, without committing.
+
         Args:
             data: Dictionary containing transaction data
-            
+
         Returns:
-            The created Transaction object
+            The staged Transaction object
         """
         # Convert date string to datetime
-        date = datetime.fromisoformat(data['date'].replace('Z', '+00:00'))
+        date = _parse_dt(data['date'])
         
+        # Intern the raw merchant name: recurring charges repeat the same
+        # string, and interned copies share storage and compare by pointer
+        # in later mapping passes
+        raw_merchant = data.get('raw_merchant', None)
+        if raw_merchant is not None:
+            raw_merchant = sys.intern(raw_merchant)
+
         transaction = Transaction(
-            id=generate_id(),
             amount=data['amount'],
             description=data['description'],
             comments=data.get('comments', ''),
             category=data['category'],
             type=data['type'],
             date=date,
-            raw_merchant=data.get('raw_merchant', None)
+            raw_merchant=raw_merchant
         )
         
         # Handle tags
@@ -93,11 +298,89 @@ class DatabaseService:
                 pass
 
         db.session.add(transaction)
-        db.session.commit()
         return transaction
 
     @staticmethod
-    def update_transaction(transaction_id, data):
+    def create_transaction(data, commit=True):
+        """
+        Create a new transaction.
+
+        Args:
+            data: Dictionary containing transaction data
+
+        Returns:
+            The created Transaction object
+        """
+        transaction = DatabaseService._build_transaction(data)
+        DatabaseService._finalize(commit)
+        return transaction
+
+    @staticmethod
+    def create_transactions(items, commit=True):
+        """
+        Create multiple transactions in a single commit.
+
+        Batching amortizes the per-commit fsync cost over all rows, which
+        is the dominant cost of high-volume inserts on SQLite.
+
+        Args:
+            items: List of dictionaries containing transaction data
+
+        Returns:
+            List of created Transaction objects
+        """
+        # One IN-query warms the budget cache for every expense row, so
+        # _build_transaction never issues per-row budget SELECTs here
+        DatabaseService.preload_budgets(DatabaseService._budget_keys_for(items))
+
+        transactions = [DatabaseService._build_transaction(data) for data in items]
+        # Mint all the ids up front from one urandom read instead of one
+        # per-row call through the column default at flush time
+        for transaction, new_id in zip(transactions, generate_ids(len(transactions))):
+            transaction.id = new_id
+        DatabaseService._finalize(commit)
+        return transactions
+
+    @staticmethod
+    def _budget_keys_for(items):
+        """Collect the (category, month, year) keys hit by expense items."""
+        keys = set()
+        for data in items:
+            if data.get('type') == 'expense':
+                date = _parse_dt(data['date'])
+                keys.add((data['category'], date.month, date.year))
+        return keys
+
+    @staticmethod
+    def create_budgets(items, commit=True):
+        """
+        Create multiple budgets in a single commit.
+
+        Args:
+            items: List of dictionaries containing budget data
+
+        Returns:
+            List of created Budget objects
+        """
+        today = datetime.now()
+        budgets = []
+        for data in items:
+            budget = Budget(
+                category=data['category'],
+                amount=data['amount'],
+                spent=0,
+                month=data.get('month', today.month),
+                year=data.get('year', today.year),
+                recurring=data.get('recurring', True)
+            )
+            db.session.add(budget)
+            budgets.append(budget)
+
+        DatabaseService._finalize(commit)
+        return budgets
+
+    @staticmethod
+    def update_transaction(transaction_id, data, commit=True):
         """
         Update an existing transaction.
 
@@ -106,11 +389,12 @@ class DatabaseService:
             data: Dictionary containing updated transaction data
 
         Returns:
-            The updated Transaction object
+            Tuple of (transaction, changed): the Transaction (or None if
+            not found) and whether anything was actually modified
         """
-        transaction = Transaction.query.get(transaction_id)
+        transaction = db.session.get(Transaction, transaction_id)
         if not transaction:
-            return None
+            return None, False
 
         # Store original values for comparison
         orig_amount = transaction.amount
@@ -119,117 +403,71 @@ class DatabaseService:
         orig_month = orig_date.month
         orig_year = orig_date.year
 
-        # Handle basic field updates
-        if 'description' in data:
+        # Handle basic field updates, skipping values that match what is
+        # already stored so a no-op PATCH never dirties the session
+        dirty = False
+        if 'description' in data and data['description'] != transaction.description:
             transaction.description = data['description']
+            dirty = True
 
-        if 'comments' in data:
+        if 'comments' in data and data['comments'] != transaction.comments:
             transaction.comments = data['comments']
+            dirty = True
 
-        if 'tags' in data:
+        if 'tags' in data and data['tags'] != transaction.tags:
             transaction.tags = data['tags']
+            dirty = True
 
         # Handle date change
         new_date = None
         if 'date' in data:
-            new_date = datetime.fromisoformat(data['date'].replace('Z', '+00:00'))
-            transaction.date = new_date
-
-        # If this is an expense transaction, we need to handle budget updates
+            new_date = _parse_dt(data['date'])
+            if new_date != orig_date:
+                transaction.date = new_date
+                transaction.__dict__.pop('_date_iso', None)
+                dirty = True
+            else:
+                new_date = None
+
+        # Resolve what the transaction should look like after the update
+        new_amount = data.get('amount', orig_amount)
+        new_category = data.get('category', orig_category)
+        new_month = new_date.month if new_date else orig_month
+        new_year = new_date.year if new_date else orig_year
+
+        if new_amount != orig_amount:
+            transaction.amount = new_amount
+            dirty = True
+
+        if new_category != orig_category:
+            transaction.category = new_category
+            dirty = True
+
+        # For expenses, move the spend as netted signed deltas: -orig from
+        # the old budget key, +new to the new one. When the key is
+        # unchanged the two entries collapse and an unchanged amount nets
+        # to zero, so a no-op edit touches no budget at all.
         if transaction.type == 'expense':
-            # Get new month/year if date changed
-            new_month = new_date.month if new_date else orig_month
-            new_year = new_date.year if new_date else orig_year
-
-            # If amount changed, update the budget
-            if 'amount' in data and data['amount'] != orig_amount:
-                # Get the budget for original month/year and category
-                old_budget = DatabaseService.get_budget_by_category_and_period(
-                    orig_category, orig_month, orig_year
-                )
-                if old_budget:
-                    old_budget.spent = max(0, old_budget.spent - orig_amount)
-
-                # Update amount for the transaction
-                transaction.amount = data['amount']
-
-                # If we're updating the category as well, use the new category
-                category_to_use = data.get('category', orig_category)
-
-                # Get the budget for the target month/year and category
-                target_budget = DatabaseService.get_budget_by_category_and_period(
-                    category_to_use, new_month, new_year
-                )
-                if target_budget:
-                    target_budget.spent += data['amount']
-
-            # If category changed but amount didn't, need to move the amount between budgets
-            elif 'category' in data and data['category'] != orig_category:
-                # Remove from old budget
-                old_budget = DatabaseService.get_budget_by_category_and_period(
-                    orig_category, orig_month, orig_year
-                )
-                if old_budget:
-                    old_budget.spent = max(0, old_budget.spent - orig_amount)
-
-                # Add to new budget
-                new_budget = DatabaseService.get_budget_by_category_and_period(
-                    data['category'], new_month, new_year
-                )
-                if new_budget:
-                    new_budget.spent += orig_amount
-
-                # Update category
-                transaction.category = data['category']
-
-            # If only the date changed (which affects month/year), move the amount between budgets
-            elif new_date and (new_month != orig_month or new_year != orig_year):
-                # Remove from old budget
-                old_budget = DatabaseService.get_budget_by_category_and_period(
-                    orig_category, orig_month, orig_year
-                )
-                if old_budget:
-                    old_budget.spent = max(0, old_budget.spent - orig_amount)
-
-                # Add to new budget
-                new_budget = DatabaseService.get_budget_by_category_and_period(
-                    orig_category, new_month, new_year
-                )
-                if new_budget:
-                    new_budget.spent += orig_amount
-
-            # If we're changing both category and date, it gets more complex
-            elif ('category' in data and data['category'] != orig_category) and \
-                 new_date and (new_month != orig_month or new_year != orig_year):
-                # Remove from old budget (original category, original month/year)
-                old_budget = DatabaseService.get_budget_by_category_and_period(
-                    orig_category, orig_month, orig_year
-                )
-                if old_budget:
-                    old_budget.spent = max(0, old_budget.spent - orig_amount)
-
-                # Add to new budget (new category, new month/year)
-                new_budget = DatabaseService.get_budget_by_category_and_period(
-                    data['category'], new_month, new_year
-                )
-                if new_budget:
-                    new_budget.spent += orig_amount
-
-                # Update category
-                transaction.category = data['category']
-        else:
-            # For non-expense transactions, handle fields normally
-            if 'amount' in data:
-                transaction.amount = data['amount']
+            old_key = (orig_category, orig_month, orig_year)
+            new_key = (new_category, new_month, new_year)
 
-            if 'category' in data:
-                transaction.category = data['category']
+            deltas = {old_key: -orig_amount}
+            deltas[new_key] = deltas.get(new_key, 0) + new_amount
 
-        db.session.commit()
-        return transaction
+            for key, delta in deltas.items():
+                if delta == 0:
+                    continue
+                budget = DatabaseService.get_budget_by_category_and_period(*key)
+                if budget:
+                    budget.spent = max(0, budget.spent + delta)
+                    dirty = True
+
+        if dirty:
+            DatabaseService._finalize(commit)
+        return transaction, dirty
 
     @staticmethod
-    def delete_transaction(transaction_id):
+    def delete_transaction(transaction_id, commit=True):
         """
         Delete a transaction.
 
@@ -239,7 +477,7 @@ class DatabaseService:
         Returns:
             True if successful, False otherwise
         """
-        transaction = Transaction.query.get(transaction_id)
+        transaction = db.session.get(Transaction, transaction_id)
         if not transaction:
             return False
 
@@ -258,35 +496,96 @@ class DatabaseService:
                 budget.spent = max(0, budget.spent - transaction.amount)
 
         db.session.delete(transaction)
-        db.session.commit()
+        DatabaseService._finalize(commit)
         return True
 
     # Budget methods
     @staticmethod
-    def get_all_budgets(month=None, year=None):
+    def get_all_budgets(month=None, year=None, limit=None, offset=None):
         """
         Get all budgets, optionally filtered by month and year.
 
         Args:
             month: Optional month (1-12) to filter by
             year: Optional year to filter by
+            limit: Optional maximum number of rows to return
+            offset: Optional number of rows to skip
 
         Returns:
             List of Budget objects
         """
-        query = Budget.query
+        query = Budget.query.options(raiseload('*'))
 
         # Filter by month and year if provided
         if month is not None and year is not None:
             query = query.filter_by(month=month, year=year)
 
         # Order by category
-        return query.order_by(Budget.category).all()
+        query = query.order_by(Budget.category)
+        if offset is not None:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    @staticmethod
+    def get_all_budgets_raw(month=None, year=None, limit=None, offset=None):
+        """
+        Get all budgets as plain dicts, bypassing ORM instantiation.
+
+        Same shape as Budget.to_dict(); see get_all_transactions_raw for
+        the rationale.
+
+        Args:
+            month: Optional month (1-12) to filter by
+            year: Optional year to filter by
+            limit: Optional maximum number of rows to return
+            offset: Optional number of rows to skip
+
+        Returns:
+            List of dicts shaped like Budget.to_dict()
+        """
+        stmt = select(
+            Budget.id, Budget.category, Budget.amount, Budget.spent,
+            Budget.month, Budget.year, Budget.recurring
+        )
+        if month is not None and year is not None:
+            stmt = stmt.where(Budget.month == month, Budget.year == year)
+        stmt = stmt.order_by(Budget.category)
+        if offset is not None:
+            stmt = stmt.offset(offset)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        return [
+            {
+                'id': row.id,
+                'category': row.category,
+                'amount': row.amount,
+                'spent': row.spent,
+                'month': row.month,
+                'year': row.year,
+                'recurring': row.recurring,
+                'period': f"{row.year}-{row.month:02d}",
+            }
+            for row in db.session.execute(stmt)
+        ]
 
     @staticmethod
     def get_budget_by_id(budget_id):
         """Get a budget by ID."""
-        return Budget.query.get(budget_id)
+        return db.session.get(Budget, budget_id)
+
+    @staticmethod
+    def _budget_cache():
+        """
+        Session-scoped cache of (category, month, year) -> Budget.
+
+        The scoped session is torn down with the request, so entries
+        never outlive it. Misses are cached as None so a burst of
+        transactions against an unbudgeted category costs one SELECT.
+        """
+        return db.session.info.setdefault('budget_cache', {})
 
     @staticmethod
     def get_budget_by_category_and_period(category, month, year):
@@ -301,14 +600,61 @@ class DatabaseService:
         Returns:
             Budget object or None if not found
         """
-        return Budget.query.filter_by(
-            category=category,
-            month=month,
-            year=year
-        ).first()
+        cache = DatabaseService._budget_cache()
+        key = (category, month, year)
+        if key not in cache:
+            cache[key] = db.session.execute(
+                _BUDGET_BY_PERIOD_STMT,
+                {'category': category, 'month': month, 'year': year}
+            ).scalar_one_or_none()
+        return cache[key]
 
     @staticmethod
-    def create_budget(data):
+    def get_budgets_by_category_and_periods(keys):
+        """
+        Fetch budgets for multiple (category, month, year) keys in one
+        SELECT and warm the session cache with the results.
+
+        Bulk writes that touch many budgets pay one IN-query round trip
+        instead of one SELECT per row.
+
+        Args:
+            keys: Iterable of (category, month, year) tuples
+
+        Returns:
+            Dictionary of (category, month, year) -> Budget (hits only)
+        """
+        keys = set(keys)
+        if not keys:
+            return {}
+
+        budgets = Budget.query.filter(
+            tuple_(Budget.category, Budget.month, Budget.year).in_(keys)
+        ).all()
+
+        found = {(b.category, b.month, b.year): b for b in budgets}
+        cache = DatabaseService._budget_cache()
+        for key in keys:
+            cache[key] = found.get(key)
+        return found
+
+    @staticmethod
+    def preload_budgets(keys):
+        """
+        Warm the session budget cache for a known set of keys.
+
+        Callers that are about to loop over many rows (bulk imports,
+        batch endpoints) call this once up front; every subsequent
+        get_budget_by_category_and_period for those keys is then served
+        from memory instead of the database.
+
+        Args:
+            keys: Iterable of (category, month, year) tuples
+        """
+        DatabaseService.get_budgets_by_category_and_periods(keys)
+
+    @staticmethod
+    def create_budget(data, commit=True):
         """
         Create a new budget.
 
@@ -324,7 +670,6 @@ class DatabaseService:
         year = data.get('year', today.year)
 
         budget = Budget(
-            id=generate_id(),
             category=data['category'],
             amount=data['amount'],
             spent=0,
@@ -334,11 +679,12 @@ class DatabaseService:
         )
 
         db.session.add(budget)
-        db.session.commit()
+        DatabaseService._finalize(commit)
+        DatabaseService._budget_cache()[(budget.category, budget.month, budget.year)] = budget
         return budget
 
     @staticmethod
-    def update_budget(budget_id, data):
+    def update_budget(budget_id, data, commit=True):
         """
         Update an existing budget.
 
@@ -347,32 +693,31 @@ class DatabaseService:
             data: Dictionary containing updated budget data
 
         Returns:
-            The updated Budget object
+            Tuple of (budget, changed): the Budget (or None if not
+            found) and whether anything was actually modified
         """
-        budget = Budget.query.get(budget_id)
+        budget = db.session.get(Budget, budget_id)
         if not budget:
-            return None
-
-        if 'amount' in data:
-            budget.amount = data['amount']
-
-        if 'spent' in data:
-            budget.spent = data['spent']
+            return None, False
 
-        if 'recurring' in data:
-            budget.recurring = data['recurring']
+        # Only assign fields that actually change, and skip the commit
+        # (and its WAL fsync) entirely for a no-op PATCH
+        dirty = False
+        for field in ('amount', 'spent', 'recurring', 'month', 'year'):
+            if field in data and getattr(budget, field) != data[field]:
+                setattr(budget, field, data[field])
+                dirty = True
 
-        if 'month' in data:
-            budget.month = data['month']
+        if not dirty:
+            return budget, False
 
-        if 'year' in data:
-            budget.year = data['year']
-
-        db.session.commit()
-        return budget
+        DatabaseService._finalize(commit)
+        # month/year/category may have moved; rebuild lazily
+        DatabaseService._budget_cache().clear()
+        return budget, True
 
     @staticmethod
-    def delete_budget(budget_id):
+    def delete_budget(budget_id, commit=True):
         """
         Delete a budget.
 
@@ -382,12 +727,14 @@ class DatabaseService:
         Returns:
             True if successful, False otherwise
         """
-        budget = Budget.query.get(budget_id)
+        budget = db.session.get(Budget, budget_id)
         if not budget:
             return False
 
         db.session.delete(budget)
-        db.session.commit()
+        DatabaseService._finalize(commit)
+        DatabaseService._budget_cache().pop(
+            (budget.category, budget.month, budget.year), None)
         return True
 
     @staticmethod
@@ -403,54 +750,73 @@ class DatabaseService:
         current_month = today.month
         current_year = today.year
 
-        # Calculate next month and year
-        next_month = current_month + 1 if current_month < 12 else 1
-        next_year = current_year if next_month > 1 else current_year + 1
+        # Calculate next month and year (wraps December without branching)
+        next_month = (current_month % 12) + 1
+        next_year = current_year + (current_month // 12)
 
         # Check if budgets already exist for next month
-        existing_next_month = Budget.query.filter_by(month=next_month, year=next_year).first()
+        existing_next_month = db.session.execute(
+            select(literal(1))
+            .where(Budget.month == next_month, Budget.year == next_year)
+            .limit(1)
+        ).first()
         if existing_next_month:
             # Budgets already exist for next month
             return []
 
-        # Get current month's recurring budgets
-        current_budgets = Budget.query.filter_by(
-            month=current_month,
-            year=current_year,
-            recurring=True
-        ).all()
-
-        # Create new budgets for next month
-        new_budgets = []
-        for budget in current_budgets:
-            new_budget = Budget(
-                id=generate_id(),
-                category=budget.category,
-                amount=budget.amount,
-                spent=0,
-                month=next_month,
-                year=next_year,
-                recurring=budget.recurring
-            )
-            db.session.add(new_budget)
-            new_budgets.append(new_budget)
-
+        # Copy the recurring budgets server-side: one INSERT ... SELECT
+        # materializes all rows in the database, with no per-row ORM
+        # objects or round trips. Ids are generated in the SELECT, since
+        # from_select would otherwise fill the Python column default once
+        # as a scalar and reuse it for every row.
+        sel = select(
+            func.lower(func.hex(func.randomblob(16))),
+            Budget.category,
+            Budget.amount,
+            literal(0.0),
+            literal(next_month),
+            literal(next_year),
+            Budget.recurring
+        ).where(
+            Budget.month == current_month,
+            Budget.year == current_year,
+            Budget.recurring == True
+        )
+        db.session.execute(insert(Budget).from_select(
+            ['id', 'category', 'amount', 'spent', 'month', 'year', 'recurring'],
+            sel
+        ))
         db.session.commit()
-        return new_budgets
+
+        return Budget.query.filter_by(month=next_month, year=next_year).all()
 
     # Savings goal methods
     @staticmethod
-    def get_all_savings_goals():
-        """Get all savings goals."""
-        return SavingsGoal.query.all()
+    def get_all_savings_goals(limit=None, offset=None):
+        """
+        Get all savings goals.
+
+        Args:
+            limit: Optional maximum number of rows to return
+            offset: Optional number of rows to skip
+
+        Returns:
+            List of SavingsGoal objects
+        """
+        query = SavingsGoal.query.options(raiseload('*'))
+        if offset is not None:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
 
     @staticmethod
     def get_savings_goal_by_id(goal_id):
         """Get a savings goal by ID."""
-        return SavingsGoal.query.get(goal_id)
+        return db.session.get(SavingsGoal, goal_id)
 
     @staticmethod
-    def create_savings_goal(data):
+    def create_savings_goal(data, commit=True):
         """
         Create a new savings goal.
 
@@ -461,21 +827,20 @@ class DatabaseService:
             The created SavingsGoal object
         """
         goal = SavingsGoal(
-            id=generate_id(),
             name=data['name'],
             targetAmount=data['targetAmount'],
             currentAmount=data.get('currentAmount', 0)
         )
 
         if 'deadline' in data and data['deadline']:
-            goal.deadline = datetime.fromisoformat(data['deadline'].replace('Z', '+00:00'))
+            goal.deadline = _parse_dt(data['deadline'])
 
         db.session.add(goal)
-        db.session.commit()
+        DatabaseService._finalize(commit)
         return goal
 
     @staticmethod
-    def update_savings_goal(goal_id, data):
+    def update_savings_goal(goal_id, data, commit=True):
         """
         Update an existing savings goal.
 
@@ -484,9 +849,10 @@ class DatabaseService:
             data: Dictionary containing updated savings goal data
 
         Returns:
-            The updated SavingsGoal object and any created transaction
+            The updated SavingsGoal object and any created contribution
+            transaction as a dict, or None
         """
-        goal = SavingsGoal.query.get(goal_id)
+        goal = db.session.get(SavingsGoal, goal_id)
         if not goal:
             return None, None
 
@@ -499,37 +865,37 @@ class DatabaseService:
             goal.targetAmount = data['targetAmount']
 
         if 'currentAmount' in data:
-            # If adding money to a savings goal, create a transaction
+            # If adding money to a savings goal, create a transaction.
+            # A Core insert skips building an ORM instance: the row is
+            # write-only here and the caller only needs the values back.
             if data['currentAmount'] > goal.currentAmount:
                 contribution_amount = data['currentAmount'] - goal.currentAmount
 
-                transaction = Transaction(
-                    id=generate_id(),
-                    amount=contribution_amount,
-                    description=f"Contribution to {goal.name}",
-                    comments="Automatic transaction for savings goal contribution",
-                    category="Savings",
-                    type="expense",
-                    date=datetime.utcnow()
-                )
-                transaction.tags = ["savings", "automatic"]
-
-                db.session.add(transaction)
-                created_transaction = transaction
+                txn_row = {
+                    'amount': contribution_amount,
+                    'description': f"Contribution to {goal.name}",
+                    'comments': "Automatic transaction for savings goal contribution",
+                    'category': "Savings",
+                    'type': "expense",
+                    'date': datetime.utcnow(),
+                    'tags': ["savings", "automatic"]
+                }
+                db.session.execute(insert(Transaction), [txn_row])
+                created_transaction = txn_row
 
             goal.currentAmount = data['currentAmount']
 
         if 'deadline' in data:
             if data['deadline']:
-                goal.deadline = datetime.fromisoformat(data['deadline'].replace('Z', '+00:00'))
+                goal.deadline = _parse_dt(data['deadline'])
             else:
                 goal.deadline = None
 
-        db.session.commit()
+        DatabaseService._finalize(commit)
         return goal, created_transaction
 
     @staticmethod
-    def delete_savings_goal(goal_id):
+    def delete_savings_goal(goal_id, commit=True):
         """
         Delete a savings goal.
 
@@ -539,7 +905,7 @@ class DatabaseService:
         Returns:
             True and any created transaction if successful, False and None otherwise
         """
-        goal = SavingsGoal.query.get(goal_id)
+        goal = db.session.get(SavingsGoal, goal_id)
         if not goal:
             return False, None
 
@@ -548,7 +914,6 @@ class DatabaseService:
         # If there was money in the goal, create a "transfer back" transaction
         if goal.currentAmount > 0:
             transaction = Transaction(
-                id=generate_id(),
                 amount=goal.currentAmount,
                 description=f"Transferred from {goal.name} savings goal",
                 comments="Automatic transaction for savings goal deletion",
@@ -562,7 +927,7 @@ class DatabaseService:
             created_transaction = transaction
 
         db.session.delete(goal)
-        db.session.commit()
+        DatabaseService._finalize(commit)
         return True, created_transaction
 
     # Merchant mapping methods
@@ -574,17 +939,51 @@ class DatabaseService:
         Returns:
             Dictionary of raw_name -> {"display_name": str, "category": str}
         """
-        mappings = MerchantMapping.query.all()
-        return {mapping.raw_name: {"display_name": mapping.display_name, "category": mapping.category}
-                for mapping in mappings}
+        # Core rows instead of ORM instances: the caller only wants a
+        # plain dict, so identity-map and instrumentation work is wasted
+        rows = db.session.execute(select(
+            MerchantMapping.raw_name,
+            MerchantMapping.display_name,
+            MerchantMapping.category
+        ))
+        return {raw_name: {"display_name": display_name, "category": category}
+                for raw_name, display_name, category in rows}
+
+    @staticmethod
+    def get_merchant_mappings_for(raw_names):
+        """
+        Get the mappings that exist for a specific set of raw names.
+
+        Args:
+            raw_names: Iterable of raw merchant names to look up
+
+        Returns:
+            Dictionary of raw_name -> {"display_name": str, "category": str}
+            containing only the names that are mapped
+        """
+        names = list(raw_names)
+        if not names:
+            return {}
+        rows = db.session.execute(select(
+            MerchantMapping.raw_name,
+            MerchantMapping.display_name,
+            MerchantMapping.category
+        ).where(MerchantMapping.raw_name.in_(names)))
+        return {raw_name: {"display_name": display_name, "category": category}
+                for raw_name, display_name, category in rows}
 
     @staticmethod
     def get_merchant_mapping_by_raw_name(raw_name):
         """Get a merchant mapping by raw name."""
-        return MerchantMapping.query.get(raw_name)
+        return db.session.get(MerchantMapping, raw_name)
 
     @staticmethod
-    def add_merchant_mapping(raw_name, display_name, category):
+    def merchant_mappings_version():
+        """Current merchant-mapping write counter (cache-key component)."""
+        return _merchant_mappings_version
+
+    @staticmethod
+    def add_merchant_mapping(raw_name, display_name, category, commit=True):
         """
         Add or update a merchant mapping.
 
@@ -596,11 +995,12 @@ class DatabaseService:
         Returns:
             The created or updated MerchantMapping object
         """
-        mapping = MerchantMapping.query.get(raw_name)
+        mapping = db.session.get(MerchantMapping, raw_name)
 
         if mapping:
             mapping.display_name = display_name
             mapping.category = category
+            mapping.invalidate_cached_dict()
         else:
             mapping = MerchantMapping(
                 raw_name=raw_name,
@@ -609,11 +1009,12 @@ class DatabaseService:
             )
             db.session.add(mapping)
 
-        db.session.commit()
+        DatabaseService._finalize(commit)
+        _bump_merchant_mappings_version()
         return mapping
 
     @staticmethod
-    def add_merchant_mappings(mappings):
+    def add_merchant_mappings(mappings, commit=True):
         """
         Add or update multiple merchant mappings.
 
@@ -621,31 +1022,39 @@ class DatabaseService:
             mappings: Dictionary of raw_name -> {"display_name": str, "category": str}
 
         Returns:
-            List of created or updated MerchantMapping objects
+            List of mapping dictionaries as stored
         """
-        updated_mappings = []
-
-        for raw_name, data in mappings.items():
-            mapping = MerchantMapping.query.get(raw_name)
-
-            if mapping:
-                mapping.display_name = data["display_name"]
-                mapping.category = data["category"]
-            else:
-                mapping = MerchantMapping(
-                    raw_name=raw_name,
-                    display_name=data["display_name"],
-                    category=data["category"]
-                )
-                db.session.add(mapping)
+        if not mappings:
+            return []
 
-            updated_mappings.append(mapping)
+        rows = [
+            {
+                "raw_name": raw_name,
+                "display_name": data["display_name"],
+                "category": data["category"]
+            }
+            for raw_name, data in mappings.items()
+        ]
 
-        db.session.commit()
-        return updated_mappings
+        # One UPSERT replaces the per-row SELECT-then-INSERT/UPDATE loop:
+        # the batch is a single statement regardless of size
+        stmt = sqlite_insert(MerchantMapping).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['raw_name'],
+            set_={
+                'display_name': stmt.excluded.display_name,
+                'category': stmt.excluded.category
+            }
+        )
+        db.session.execute(stmt)
+        DatabaseService._finalize(commit)
+        _bump_merchant_mappings_version()
+        # Any mappings already in the identity map now have stale state
+        db.session.expire_all()
+        return rows
 
     @staticmethod
-    def delete_merchant_mapping(raw_name):
+    def delete_merchant_mapping(raw_name, commit=True):
         """
         Delete a merchant mapping.
 
@@ -655,12 +1064,13 @@ class DatabaseService:
         Returns:
             True if successful, False otherwise
         """
-        mapping = MerchantMapping.query.get(raw_name)
+        mapping = db.session.get(MerchantMapping, raw_name)
         if not mapping:
             return False
 
         db.session.delete(mapping)
-        db.session.commit()
+        DatabaseService._finalize(commit)
+        _bump_merchant_mappings_version()
         return True
 
     # Summary methods
@@ -672,11 +1082,21 @@ class DatabaseService:
         Returns:
             Dictionary with total income, expenses, savings, and available balance
         """
-        total_income = db.session.query(db.func.sum(Transaction.amount)).filter(
-            Transaction.type == 'income').scalar() or 0
-        total_expenses = db.session.query(db.func.sum(Transaction.amount)).filter(
-            Transaction.type == 'expense').scalar() or 0
-        total_savings = db.session.query(db.func.sum(SavingsGoal.currentAmount)).scalar() or 0
+        # Conditional aggregation folds both transaction totals into one
+        # scan instead of two separate filtered SUM queries
+        total_income, total_expenses = db.session.execute(
+            select(
+                func.coalesce(func.sum(case(
+                    (Transaction.type == 'income', Transaction.amount),
+                    else_=0)), 0),
+                func.coalesce(func.sum(case(
+                    (Transaction.type == 'expense', Transaction.amount),
+                    else_=0)), 0)
+            )
+        ).one()
+        total_savings = db.session.execute(
+            select(func.coalesce(func.sum(SavingsGoal.currentAmount), 0))
+        ).scalar_one()
 
         return {
             'totalIncome': total_income,
@@ -694,148 +1114,74 @@ class DatabaseService:
         Returns:
             Dictionary with counts of seeded items
         """
-        # Clear existing data
-        Transaction.query.delete()
-        Budget.query.delete()
-        SavingsGoal.query.delete()
-
-        # Add sample transactions
-        transactions = [
-            Transaction(
-                id=generate_id(),
-                amount=1500,
-                description='Internship Stipend',
-                comments='Monthly stipend',
-                category='Salary',
-                type='income',
-                date=datetime.now()
-            ),
-            Transaction(
-                id=generate_id(),
-                amount=25,
-                description='Coffee shop',
-                comments='Morning coffee with friends',
-                category='Food & Drinks',
-                type='expense',
-                date=datetime.now()
-            ),
-            Transaction(
-                id=generate_id(),
-                amount=50,
-                description='Textbooks',
-                comments='Computer Science textbook',
-                category='Education',
-                type='expense',
-                date=datetime.now()
-            ),
-            Transaction(
-                id=generate_id(),
-                amount=200,
-                description='Freelance project',
-                comments='Website design for local business',
-                category='Side Hustle',
-                type='income',
-                date=datetime.now()
-            )
-        ]
-
-        # Set tags for transactions
-        transactions[0].tags = ['income', 'work']
-        transactions[1].tags = ['food', 'social']
-        transactions[2].tags = ['education', 'books']
-        transactions[3].tags = ['income', 'freelance']
+        # Clear existing data with plain DELETE statements; the Query API
+        # would sync each deletion back into the session for no benefit here
+        db.session.execute(delete(Transaction))
+        db.session.execute(delete(Budget))
+        db.session.execute(delete(SavingsGoal))
 
         # Get current month/year
         today = datetime.now()
         current_month = today.month
         current_year = today.year
 
-        # Add sample budgets for current month
-        budgets = [
-            Budget(
-                id=generate_id(),
-                category='Food & Drinks',
-                amount=300,
-                spent=25,
-                month=current_month,
-                year=current_year,
-                recurring=True
-            ),
-            Budget(
-                id=generate_id(),
-                category='Transportation',
-                amount=200,
-                spent=0,
-                month=current_month,
-                year=current_year,
-                recurring=True
-            ),
-            Budget(
-                id=generate_id(),
-                category='Entertainment',
-                amount=100,
-                spent=0,
-                month=current_month,
-                year=current_year,
-                recurring=True
-            ),
-            Budget(
-                id=generate_id(),
-                category='Education',
-                amount=150,
-                spent=50,
-                month=current_month,
-                year=current_year,
-                recurring=True
-            )
+        # Sample rows as plain dicts: Core executemany inserts skip ORM
+        # instance construction and reuse one prepared statement per table
+        txn_rows = [
+            {'amount': 1500, 'description': 'Internship Stipend',
+             'comments': 'Monthly stipend', 'category': 'Salary',
+             'type': 'income', 'date': datetime.now(),
+             'tags': ['income', 'work']},
+            {'amount': 25, 'description': 'Coffee shop',
+             'comments': 'Morning coffee with friends', 'category': 'Food & Drinks',
+             'type': 'expense', 'date': datetime.now(),
+             'tags': ['food', 'social']},
+            {'amount': 50, 'description': 'Textbooks',
+             'comments': 'Computer Science textbook', 'category': 'Education',
+             'type': 'expense', 'date': datetime.now(),
+             'tags': ['education', 'books']},
+            {'amount': 200, 'description': 'Freelance project',
+             'comments': 'Website design for local business', 'category': 'Side Hustle',
+             'type': 'income', 'date': datetime.now(),
+             'tags': ['income', 'freelance']},
         ]
 
-        # Add sample savings goals
-        goals = [
-            SavingsGoal(
-                id=generate_id(),
-                name='Emergency Fund',
-                targetAmount=1000,
-                currentAmount=500,
-                deadline=datetime.now()
-            ),
-            SavingsGoal(
-                id=generate_id(),
-                name='New Laptop',
-                targetAmount=1200,
-                currentAmount=300,
-                deadline=datetime.now()
-            )
+        budget_rows = [
+            {'category': 'Food & Drinks', 'amount': 300, 'spent': 25,
+             'month': current_month, 'year': current_year, 'recurring': True},
+            {'category': 'Transportation', 'amount': 200, 'spent': 0,
+             'month': current_month, 'year': current_year, 'recurring': True},
+            {'category': 'Entertainment', 'amount': 100, 'spent': 0,
+             'month': current_month, 'year': current_year, 'recurring': True},
+            {'category': 'Education', 'amount': 150, 'spent': 50,
+             'month': current_month, 'year': current_year, 'recurring': True},
         ]
 
-        # Add sample merchant mappings
-        mappings = [
-            MerchantMapping(
-                raw_name="IC* INSTACART",
-                display_name="Instacart",
-                category="Food & Drinks"
-            ),
-            MerchantMapping(
-                raw_name="TIM HORTONS #",
-                display_name="Tim Hortons",
-                category="Food & Drinks"
-            ),
-            MerchantMapping(
-                raw_name="PRESTO APPL/",
-                display_name="Presto Transit",
-                category="Transportation"
-            )
+        goal_rows = [
+            {'name': 'Emergency Fund', 'targetAmount': 1000,
+             'currentAmount': 500, 'deadline': datetime.now()},
+            {'name': 'New Laptop', 'targetAmount': 1200,
+             'currentAmount': 300, 'deadline': datetime.now()},
+        ]
+
+        mapping_rows = [
+            {'raw_name': 'IC* INSTACART', 'display_name': 'Instacart',
+             'category': 'Food & Drinks'},
+            {'raw_name': 'TIM HORTONS #', 'display_name': 'Tim Hortons',
+             'category': 'Food & Drinks'},
+            {'raw_name': 'PRESTO APPL/', 'display_name': 'Presto Transit',
+             'category': 'Transportation'},
         ]
 
-        db.session.add_all(transactions)
-        db.session.add_all(budgets)
-        db.session.add_all(goals)
-        db.session.add_all(mappings)
+        db.session.execute(insert(Transaction), txn_rows)
+        db.session.execute(insert(Budget), budget_rows)
+        db.session.execute(insert(SavingsGoal), goal_rows)
+        db.session.execute(insert(MerchantMapping), mapping_rows)
         db.session.commit()
 
         return {
-            "transactions": len(transactions),
-            "budgets": len(budgets),
-            "savings_goals": len(goals),
-            "merchant_mappings": len(mappings)
+            "transactions": len(txn_rows),
+            "budgets": len(budget_rows),
+            "savings_goals": len(goal_rows),
+            "merchant_mappings": len(mapping_rows)
         }
\ No newline at end of file
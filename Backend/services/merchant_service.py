@@ -3,10 +3,33 @@ Merchant service for the Finance Tracker application.
 
 This module provides services for merchant name mapping and suggestions.
 """
+import sys
 from typing import Dict, List, Set, Tuple, Any
-import re
+
+try:
+    # C automaton for multi-pattern substring search; optional so the
+    # service still works (slower) where the extension is unavailable
+    import ahocorasick
+except ImportError:  # pragma: no cover - pure-Python fallback
+    ahocorasick = None
+
+try:
+    # Bit-parallel fuzzy matching to catch near-duplicate merchant names
+    from rapidfuzz import fuzz, process as rf_process
+except ImportError:  # pragma: no cover - fuzzy matching becomes a no-op
+    rf_process = None
+
 from .db_service import DatabaseService
-from utils.merchant_name import MerchantNameSuggester
+from utils.categories import AVAILABLE_CATEGORIES, AVAILABLE_CATEGORIES_SET
+from utils.merchant_name import MerchantNameSuggester, basic_cleanup
+
+# One automaton, prefix trie, and pattern list per distinct mapping-key
+# set; rebuilt only when the mappings change, not per matched transaction
+_automaton_cache = {'key': None, 'automaton': None, 'patterns': None,
+                    'trie': None}
+
+# Sentinel key under which a trie node stores its mapping payload
+_TRIE_VALUE = object()
 
 
 class MerchantService:
@@ -15,24 +38,105 @@ class MerchantService:
     Provides methods for merchant name mapping and suggestions.
     """
     
-    AVAILABLE_CATEGORIES = [
-        'Food & Drinks',
-        'Groceries',
-        'Transportation',
-        'Entertainment', 
-        'Education', 
-        'Shopping', 
-        'Health', 
-        'Bills', 
-        'Rent',
-        'Salary',
-        'Freelance',
-        'Investments',
-        'Side Hustle',
-        'Savings',
-        'Other'
-    ]
+    # Ordered list for display, frozen set for O(1) validation; both
+    # come from the shared utils.categories definition
+    AVAILABLE_CATEGORIES = AVAILABLE_CATEGORIES
+    AVAILABLE_CATEGORIES_SET = AVAILABLE_CATEGORIES_SET
     
+    @staticmethod
+    def _mappings_cache_key(mappings: Dict[str, Dict[str, str]]):
+        """
+        Cache key for the automaton/trie built over a mappings dict.
+
+        Hashing only the keys is not enough: a value-only edit (same
+        raw_name, new display name) would keep serving the old payload.
+        The database write counter changes on every mapping mutation, so
+        pairing it with the key hash invalidates on both kinds of change.
+        """
+        return (DatabaseService.merchant_mappings_version(),
+                hash(tuple(mappings)))
+
+    @staticmethod
+    def _build_automaton(mappings: Dict[str, Dict[str, str]]):
+        """
+        Build (or fetch the cached) Aho-Corasick automaton over the
+        mapping patterns.
+
+        Matching every pattern against a merchant string is O(len(name))
+        through the automaton, independent of how many mappings exist,
+        versus the O(patterns * len(name)) substring scan.
+
+        Args:
+            mappings: Dictionary of raw_name -> {"display_name": str, "category": str}
+
+        Returns:
+            The automaton, or None when pyahocorasick is not installed
+        """
+        if ahocorasick is None or not mappings:
+            return None
+
+        key = MerchantService._mappings_cache_key(mappings)
+        if _automaton_cache['key'] != key or _automaton_cache['automaton'] is None:
+            automaton = ahocorasick.Automaton()
+            for raw_pattern, info in mappings.items():
+                automaton.add_word(raw_pattern, (raw_pattern, info))
+            automaton.make_automaton()
+            _automaton_cache['key'] = key
+            _automaton_cache['automaton'] = automaton
+            _automaton_cache['patterns'] = list(mappings)
+        return _automaton_cache['automaton']
+
+    @staticmethod
+    def _build_trie(mappings: Dict[str, Dict[str, str]]):
+        """
+        Build (or fetch the cached) character trie over the mapping keys.
+
+        Many real mappings are prefix-anchored ("STARBUCKS " covers every
+        store variant); walking the trie answers longest-prefix-match in
+        O(len(name)) with plain dict hops and no automaton state.
+
+        Args:
+            mappings: Dictionary of raw_name -> {"display_name": str, "category": str}
+
+        Returns:
+            The trie root dict, or None when there are no mappings
+        """
+        if not mappings:
+            return None
+
+        key = MerchantService._mappings_cache_key(mappings)
+        if _automaton_cache['key'] == key and _automaton_cache['trie'] is not None:
+            return _automaton_cache['trie']
+
+        root = {}
+        for raw_pattern, info in mappings.items():
+            node = root
+            for char in raw_pattern:
+                node = node.setdefault(char, {})
+            node[_TRIE_VALUE] = info
+
+        # Cache alongside the automaton under the same mappings key
+        if _automaton_cache['key'] != key:
+            _automaton_cache['key'] = key
+            _automaton_cache['automaton'] = None
+            _automaton_cache['patterns'] = list(mappings)
+        _automaton_cache['trie'] = root
+        return root
+
+    @staticmethod
+    def _trie_longest_prefix(trie, merchant_name: str):
+        """Return the payload of the longest mapping key prefixing the name."""
+        best = None
+        node = trie
+        for char in merchant_name:
+            node = node.get(char)
+            if node is None:
+                break
+            value = node.get(_TRIE_VALUE)
+            if value is not None:
+                best = value
+        return best
+
     @staticmethod
     def match_merchant_name(merchant_name: str, mappings: Dict[str, Dict[str, str]]) -> Tuple[str, str, bool]:
         """
@@ -49,12 +153,45 @@ class MerchantService:
         if merchant_name in mappings:
             info = mappings[merchant_name]
             return info["display_name"], info["category"], True
-            
-        # Check for partial matches
-        for raw_pattern, info in mappings.items():
-            if raw_pattern in merchant_name:
+
+        # Longest-prefix match through the trie catches the common
+        # prefix-anchored patterns with plain dict hops
+        trie = MerchantService._build_trie(mappings)
+        if trie is not None:
+            info = MerchantService._trie_longest_prefix(trie, merchant_name)
+            if info is not None:
+                return info["display_name"], info["category"], True
+
+        # Check for partial matches in one pass over the string,
+        # preferring the longest matching pattern
+        automaton = MerchantService._build_automaton(mappings)
+        if automaton is not None:
+            best = None
+            for _, (raw_pattern, info) in automaton.iter(merchant_name):
+                if best is None or len(raw_pattern) > len(best[0]):
+                    best = (raw_pattern, info)
+            if best is not None:
+                info = best[1]
+                return info["display_name"], info["category"], True
+        else:
+            for raw_pattern, info in mappings.items():
+                if raw_pattern in merchant_name:
+                    return info["display_name"], info["category"], True
+
+        # Last resort: fuzzy-match near-duplicates ("STARBUCKS #123" vs
+        # "STARBUCKS STORE 45") with a bit-parallel scorer, so close
+        # variants resolve locally instead of going to the Gemini path
+        if rf_process is not None and mappings:
+            patterns = _automaton_cache['patterns'] \
+                if _automaton_cache['patterns'] is not None else list(mappings)
+            match = rf_process.extractOne(
+                merchant_name, patterns,
+                scorer=fuzz.partial_ratio, score_cutoff=90
+            )
+            if match is not None:
+                info = mappings[match[0]]
                 return info["display_name"], info["category"], True
-                
+
         # Return original if no match found
         return merchant_name, "Other", False
     
@@ -69,19 +206,7 @@ class MerchantService:
         Returns:
             Cleaned display name
         """
-        # Remove common prefixes
-        for prefix in ["IC*", "SQ *", "TST*"]:
-            if merchant_name.startswith(prefix):
-                merchant_name = merchant_name[len(prefix):].strip()
-                
-        # Remove any trailing numbers and special characters
-        merchant_name = re.sub(r'#\d+', '', merchant_name).strip()
-        merchant_name = re.sub(r'\s+\d+', '', merchant_name).strip()
-        
-        # Title case
-        merchant_name = ' '.join(word.capitalize() for word in merchant_name.lower().split())
-        
-        return merchant_name
+        return basic_cleanup(merchant_name)
     
     @staticmethod
     def identify_unmapped_merchants(transactions: List[Dict], merchant_mappings: Dict[str, Dict[str, str]]) -> Set[str]:
@@ -95,18 +220,55 @@ class MerchantService:
         Returns:
             Set of unmapped merchant names
         """
+        _, unmapped_merchants = MerchantService.reconcile(transactions, merchant_mappings)
+        return unmapped_merchants
+
+    @staticmethod
+    def reconcile(transactions: List[Dict],
+                  merchant_mappings: Dict[str, Dict[str, str]]) -> Tuple[Dict[str, Tuple[str, str]], Set[str]]:
+        """
+        Resolve every transaction's raw merchant in a single pass.
+
+        Bulk imports previously walked the transactions once to find
+        unmapped names and then matched the same names again to apply
+        mappings; this does both in one iteration, with each distinct
+        raw name matched exactly once.
+
+        Args:
+            transactions: List of transaction dictionaries
+            merchant_mappings: Dictionary of merchant mappings
+
+        Returns:
+            Tuple of (matched, unmapped): matched maps raw_name ->
+            (display_name, category) for names that resolved through a
+            mapping; unmapped is the set of names that did not
+        """
+        # Interning lets repeated lookups on recurring charges compare
+        # by pointer instead of re-hashing the same string; the matched/
+        # unmapped membership tests then skip duplicates entirely, so
+        # the automaton pass only ever sees each distinct name once.
+        matched = {}
         unmapped_merchants = set()
-        
         for transaction in transactions:
-            if 'raw_merchant' in transaction:
-                merchant_name = transaction['raw_merchant']
-                _, _, was_mapped = MerchantService.match_merchant_name(merchant_name, merchant_mappings)
-                
-                if not was_mapped:
-                    unmapped_merchants.add(merchant_name)
-                    
-        return unmapped_merchants
-    
+            merchant_name = transaction.get('raw_merchant')
+            if merchant_name is None:
+                continue
+            merchant_name = sys.intern(merchant_name)
+            if merchant_name in matched or merchant_name in unmapped_merchants:
+                continue
+            direct = merchant_mappings.get(merchant_name)
+            if direct is not None:
+                matched[merchant_name] = (direct["display_name"], direct["category"])
+                continue
+            display_name, category, was_mapped = MerchantService.match_merchant_name(
+                merchant_name, merchant_mappings)
+            if was_mapped:
+                matched[merchant_name] = (display_name, category)
+            else:
+                unmapped_merchants.add(merchant_name)
+        return matched, unmapped_merchants
+
+
     @staticmethod
     def process_merchant_suggestions(unmapped_merchants: Set[str], api_key: str = None):
         """
@@ -121,35 +283,43 @@ class MerchantService:
         """
         if not unmapped_merchants:
             return {}
-            
+
+        # Another request may have mapped some of these names since the
+        # caller computed its unmapped set; re-check the database so only
+        # the true remainder goes to the API. On a re-run of the same
+        # import this resolves everything without a single API call.
+        already_mapped = DatabaseService.get_merchant_mappings_for(unmapped_merchants)
+        to_suggest = set(unmapped_merchants) - already_mapped.keys()
+        if not to_suggest:
+            return already_mapped
+
         try:
             # Get merchant mappings from database
             merchant_mappings = DatabaseService.get_all_merchant_mappings()
-            
+
             # Get merchant name suggestions
             suggester = MerchantNameSuggester(api_key)
+            # Sorted rather than set order: identical inputs always
+            # produce identical batches, which keeps the on-disk cache
+            # and the provider's prompt caching stable between runs
             suggested_mappings = suggester.get_display_name_suggestions(
-                list(unmapped_merchants),
+                sorted(to_suggest),
                 merchant_mappings
             )
-            
-            # Add suggested mappings to the database
-            DatabaseService.add_merchant_mappings(suggested_mappings)
-            
-            return suggested_mappings
-            
         except Exception as e:
             print(f"Error getting merchant name suggestions: {e}")
-            
+
             # Fallback: Use basic cleanup for merchant names
-            fallback_mappings = {}
-            for merchant in unmapped_merchants:
-                fallback_mappings[merchant] = {
+            suggested_mappings = {
+                merchant: {
                     "display_name": MerchantService.basic_cleanup(merchant),
                     "category": "Other"
                 }
-                
-            # Add fallback mappings to the database
-            DatabaseService.add_merchant_mappings(fallback_mappings)
-            
-            return fallback_mappings
+                for merchant in to_suggest
+            }
+
+        # Only the fresh suggestions land in the database through the
+        # single-statement UPSERT; the already-mapped rows are there
+        DatabaseService.add_merchant_mappings(suggested_mappings)
+
+        return {**already_mapped, **suggested_mappings}
@@ -5,14 +5,55 @@ This module defines all database models using SQLAlchemy.
 """
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
-import uuid
+import os
+import time
 
-# Initialize SQLAlchemy
-db = SQLAlchemy()
+# Initialize SQLAlchemy. Autoflush is off: service methods flush or
+# commit explicitly, so reads never trigger surprise mid-method flushes.
+# expire_on_commit is off so objects stay readable after the commit
+# instead of silently re-SELECTing themselves when serialized.
+db = SQLAlchemy(session_options={'autoflush': False, 'expire_on_commit': False})
 
 def generate_id():
-    """Generate a unique ID for database records."""
-    return str(uuid.uuid4())
+    """
+    Generate a unique, time-ordered ID for database records.
+
+    UUIDv7 layout: a 48-bit millisecond timestamp followed by random
+    bits. Ids minted later sort later, so primary-key inserts append at
+    the right edge of the B-tree instead of dirtying random index pages
+    the way fully random uuid4 values do.
+
+    Rendered as 32 hex chars rather than the hyphenated form: no UUID
+    object allocation per row, 4 bytes less per key, and the same format
+    the server-side default (hex(randomblob(16))) produces.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand_a, rand_b = divmod(int.from_bytes(os.urandom(10), 'big'), 1 << 62)
+    value = (timestamp_ms << 80) | (0x7 << 76) | ((rand_a & 0xFFF) << 64) \
+        | (0b10 << 62) | rand_b
+    return format(value, '032x')
+
+
+def generate_ids(n):
+    """
+    Generate n ids for a bulk insert from one urandom read.
+
+    Same UUIDv7 layout as generate_id, but the random bytes come from a
+    single os.urandom call instead of one syscall per row, and the
+    timestamp is read once for the whole batch.
+    """
+    buf = os.urandom(10 * n)
+    head = (time.time_ns() // 1_000_000) << 80 | 0x7 << 76
+    ids = []
+    for i in range(0, 10 * n, 10):
+        rand_a, rand_b = divmod(int.from_bytes(buf[i:i + 10], 'big'), 1 << 62)
+        ids.append(format(head | (rand_a & 0xFFF) << 64 | 0b10 << 62 | rand_b,
+                          '032x'))
+    return ids
+
+# Server-side id default: Core inserts (INSERT ... SELECT, upserts) can
+# omit the id column entirely and let SQLite mint one inside the INSERT
+_server_id = db.text("(lower(hex(randomblob(16))))")
 
 # Models
 class Transaction(db.Model):
@@ -22,7 +63,8 @@ class Transaction(db.Model):
     """
     __tablename__ = 'transactions'
     
-    id = db.Column(db.String(36), primary_key=True, default=generate_id)
+    id = db.Column(db.String(32), primary_key=True, default=generate_id,
+                   server_default=_server_id)
     amount = db.Column(db.Float, nullable=False)
     description = db.Column(db.String(255), nullable=False)
     comments = db.Column(db.Text, nullable=True)
@@ -32,33 +74,39 @@ class Transaction(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     raw_merchant = db.Column(db.String(255), nullable=True)  # Original merchant name
 
-    # Store tags as comma-separated values
-    _tags = db.Column('tags', db.String(255), nullable=True)
-
-    @property
-    def tags(self):
-        """Get tags as a list."""
-        return self._tags.split(',') if self._tags else []
+    # Tags as a JSON array: stored and returned as a real list, no
+    # per-access split/join, and filterable server-side on backends
+    # with JSON operators
+    tags = db.Column(db.JSON, nullable=True, default=list)
 
-    @tags.setter
-    def tags(self, value):
-        """Set tags from a list."""
-        if isinstance(value, list):
-            self._tags = ','.join(value)
-        else:
-            self._tags = value
+    __table_args__ = (
+        # Covering index so the summary aggregates never touch the heap
+        db.Index('idx_transaction_type_amount', 'type', 'amount'),
+        # Keyset-pagination cursor: seek directly to (date, id)
+        db.Index('idx_transaction_date_id', 'date', 'id'),
+        # Common filter shapes: per-type and per-category date ranges,
+        # plus merchant lookups during mapping passes
+        db.Index('idx_transaction_type_date', 'type', 'date'),
+        db.Index('idx_transaction_category_date', 'category', 'date'),
+        db.Index('idx_transaction_raw_merchant', 'raw_merchant'),
+    )
 
     def to_dict(self):
         """Convert transaction to dictionary."""
+        # isoformat is the expensive part of serializing a row; cache it
+        # per instance since date rarely changes after creation
+        date_iso = self.__dict__.get('_date_iso')
+        if date_iso is None:
+            date_iso = self._date_iso = self.date.isoformat()
         return {
             'id': self.id,
             'amount': self.amount,
             'description': self.description,
             'comments': self.comments,
-            'tags': self.tags,
+            'tags': self.tags or [],
             'category': self.category,
             'type': self.type,
-            'date': self.date.isoformat(),
+            'date': date_iso,
         }
 
 
@@ -66,7 +114,8 @@ class Budget(db.Model):
     """Model for budget categories with monthly tracking."""
     __tablename__ = 'budgets'
 
-    id = db.Column(db.String(36), primary_key=True, default=generate_id)
+    id = db.Column(db.String(32), primary_key=True, default=generate_id,
+                   server_default=_server_id)
     category = db.Column(db.String(100), nullable=False)
     amount = db.Column(db.Float, nullable=False)
     spent = db.Column(db.Float, default=0.0)
@@ -75,9 +124,14 @@ class Budget(db.Model):
     recurring = db.Column(db.Boolean, default=True)  # Whether to recreate this budget next month
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
-    # Composite index to ensure we can quickly find budgets by category and period
+    # Composite indexes to ensure we can quickly find budgets by category
+    # and period, and filter whole periods (the get_all_budgets hot path).
+    # The category/period index is unique: one budget per category per
+    # month, and the per-write lookup becomes a plain B-tree probe.
     __table_args__ = (
-        db.Index('idx_budget_category_period', 'category', 'month', 'year'),
+        db.Index('idx_budget_category_period', 'category', 'month', 'year',
+                 unique=True),
+        db.Index('idx_budget_month_year', 'month', 'year'),
     )
 
     def to_dict(self):
@@ -98,7 +152,8 @@ class SavingsGoal(db.Model):
     """Model for savings goals."""
     __tablename__ = 'savings_goals'
 
-    id = db.Column(db.String(36), primary_key=True, default=generate_id)
+    id = db.Column(db.String(32), primary_key=True, default=generate_id,
+                   server_default=_server_id)
     name = db.Column(db.String(100), nullable=False)
     targetAmount = db.Column(db.Float, nullable=False)
     currentAmount = db.Column(db.Float, default=0.0)
@@ -128,9 +183,19 @@ class MerchantMapping(db.Model):
     category = db.Column(db.String(100), nullable=False)
 
     def to_dict(self):
-        """Convert merchant mapping to dictionary."""
-        return {
-            'raw_name': self.raw_name,
-            'display_name': self.display_name,
-            'category': self.category
-        }
\ No newline at end of file
+        """Convert merchant mapping to dictionary (memoized per instance)."""
+        # Mappings are effectively immutable between edits, so cache the
+        # dict on the instance; the service layer drops it on update.
+        cached = self.__dict__.get('_cached_dict')
+        if cached is None:
+            cached = {
+                'raw_name': self.raw_name,
+                'display_name': self.display_name,
+                'category': self.category
+            }
+            self._cached_dict = cached
+        return cached
+
+    def invalidate_cached_dict(self):
+        """Drop the memoized to_dict payload after a mutation."""
+        self.__dict__.pop('_cached_dict', None)
\ No newline at end of file
@@ -0,0 +1,28 @@
+"""
+Shared transaction category definitions.
+
+Single source of truth for the category names used across the merchant
+service and the Gemini prompt, so the two can't drift apart.
+"""
+
+# Ordered for display and prompt enumeration
+AVAILABLE_CATEGORIES = [
+    'Food & Drinks',
+    'Groceries',
+    'Transportation',
+    'Entertainment',
+    'Education',
+    'Shopping',
+    'Health',
+    'Bills',
+    'Rent',
+    'Salary',
+    'Freelance',
+    'Investments',
+    'Side Hustle',
+    'Savings',
+    'Other'
+]
+
+# Frozen set for O(1) membership checks on validation paths
+AVAILABLE_CATEGORIES_SET = frozenset(AVAILABLE_CATEGORIES)
@@ -8,10 +8,118 @@ existing merchant mappings for naming pattern consistency.
 import json
 import os
 import re
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import Dict, List, Tuple
 
 import google.generativeai as genai
 
+from utils.categories import AVAILABLE_CATEGORIES, AVAILABLE_CATEGORIES_SET
+
+# Precompiled once: the prefix strip and both trailing-number rules are
+# fused into single patterns so cleanup is two sub calls, not a loop
+# plus two uncached re.sub passes
+_PREFIXES = ("IC*", "SQ *", "TST*")
+_PREFIX_RE = re.compile(r"^(?:IC\*|SQ \*|TST\*)\s*")
+_TRAIL_RE = re.compile(r"#\d+|\s+\d+")
+_WORD_RE = re.compile(r"\S+")
+
+
+def basic_cleanup(merchant_name: str) -> str:
+    """
+    Basic cleanup for merchant names when no mapping or suggestion exists.
+
+    Args:
+        merchant_name: Raw merchant name
+
+    Returns:
+        Cleaned display name
+    """
+    # Remove common prefixes and trailing numbers/identifiers. The
+    # tuple startswith is one C call that skips the regex machinery for
+    # the common case of no prefix at all.
+    if merchant_name.startswith(_PREFIXES):
+        merchant_name = _PREFIX_RE.sub('', merchant_name)
+    merchant_name = _TRAIL_RE.sub('', merchant_name).strip()
+
+    # Title case in a single regex pass; capitalizing each whitespace-
+    # delimited token avoids str.title's re-capitalization after
+    # apostrophes. The join/split collapses internal whitespace runs the
+    # way the old split/capitalize/join did, so fallback display names
+    # stay byte-identical to previously stored mappings.
+    cleaned = _WORD_RE.sub(lambda m: m.group(0).capitalize(), merchant_name.lower())
+    return ' '.join(cleaned.split())
+
+
+# The category menu shown to Gemini is fixed; render it once at import
+_CATEGORIES_BLOCK = "\n".join(f"- {category}" for category in AVAILABLE_CATEGORIES)
+
+
+def _norm(merchant_name: str) -> str:
+    """Normalize a raw merchant name into a stable cache key."""
+    return ' '.join(merchant_name.upper().split())
+
+
+class _SuggestionCache:
+    """
+    Persistent suggestion cache backed by a small SQLite file.
+
+    Suggestions are network-priced: once Gemini has named a merchant,
+    re-running an import (or crashing halfway through one) should never
+    pay that round trip again. Keys are normalized raw names.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.environ.get(
+            'MERCHANT_CACHE_PATH',
+            os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         '.merchant_cache.db')
+        )
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS suggestions ('
+            'raw_name TEXT PRIMARY KEY, display_name TEXT, category TEXT)'
+        )
+        self._conn.commit()
+
+    def get(self, merchant_name):
+        """Return the cached suggestion dict, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT display_name, category FROM suggestions WHERE raw_name = ?',
+                (_norm(merchant_name),)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"display_name": row[0], "category": row[1]}
+
+    def put_many(self, suggestions):
+        """Store a raw_name -> {display_name, category} dict of suggestions."""
+        if not suggestions:
+            return
+        with self._lock:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO suggestions VALUES (?, ?, ?)',
+                [(_norm(raw), data['display_name'], data['category'])
+                 for raw, data in suggestions.items()]
+            )
+            self._conn.commit()
+
+
+_suggestion_cache = None
+
+
+def _get_suggestion_cache():
+    """Lazily open the shared on-disk suggestion cache."""
+    global _suggestion_cache
+    if _suggestion_cache is None:
+        _suggestion_cache = _SuggestionCache()
+    return _suggestion_cache
+
+
 class MerchantNameSuggester:
     """
     Class for suggesting merchant display names and categories using Gemini API.
@@ -47,15 +155,42 @@ class MerchantNameSuggester:
         Returns:
             Dictionary of raw_name -> {"display_name": str, "category": str}
         """
-        # Process merchants in batches to avoid very large prompts
-        suggested_mappings = {}
-
-        # Process merchants in batches
-        for i in range(0, len(unmapped_merchants), batch_size):
-            batch = unmapped_merchants[i:i+batch_size]
-            batch_suggestions = self._process_merchant_batch(batch, existing_mappings)
-            suggested_mappings.update(batch_suggestions)
+        # Serve merchants already named in a previous run straight from
+        # the on-disk cache; only the rest go to the API
+        # The mapping context is identical for every batch in this call;
+        # format it once instead of per batch inside _build_prompt
+        self._mapping_context = "\n".join(
+            f"- Raw name: '{raw}' → Display name: '{data['display_name']}', Category: '{data['category']}'"
+            for raw, data in existing_mappings.items()
+        )
 
+        cache = _get_suggestion_cache()
+        suggested_mappings = {}
+        to_query = []
+        for merchant in unmapped_merchants:
+            cached = cache.get(merchant)
+            if cached is not None:
+                suggested_mappings[merchant] = cached
+            else:
+                to_query.append(merchant)
+
+        # Process the remaining merchants in batches to avoid very large
+        # prompts. Each batch blocks on a network round trip, so batches
+        # run concurrently on a bounded pool and the round trips overlap.
+        # Batches are cut lazily with islice as the pool consumes them
+        # rather than pre-sliced into a list of lists.
+        fresh = {}
+        if to_query:
+            batch_count = -(-len(to_query) // batch_size)
+            batch_iter = iter(to_query)
+            with ThreadPoolExecutor(max_workers=min(8, batch_count)) as executor:
+                for batch_suggestions in executor.map(
+                        lambda batch: self._process_merchant_batch(batch, existing_mappings),
+                        iter(lambda: list(islice(batch_iter, batch_size)), [])):
+                    fresh.update(batch_suggestions)
+
+        cache.put_many(fresh)
+        suggested_mappings.update(fresh)
         return suggested_mappings
 
     def _process_merchant_batch(self,
@@ -84,6 +219,9 @@ class MerchantNameSuggester:
                     "top_p": 0.95,
                     "top_k": 40,
                     "max_output_tokens": 1024,
+                    # Constrained JSON output: the response is parseable
+                    # directly, no prose to trim around it
+                    "response_mime_type": "application/json",
                 },
             )
 
@@ -108,33 +246,19 @@ class MerchantNameSuggester:
         Returns:
             Formatted prompt for Gemini
         """
-        # Convert existing mappings to a formatted string for context
-        mapping_examples = "\n".join([
-            f"- Raw name: '{raw}' → Display name: '{data['display_name']}', Category: '{data['category']}'"
-            for raw, data in existing_mappings.items()
-        ])
+        # Mapping context was precomputed by get_display_name_suggestions;
+        # fall back to formatting here for direct calls
+        mapping_examples = getattr(self, '_mapping_context', None)
+        if mapping_examples is None:
+            mapping_examples = "\n".join(
+                f"- Raw name: '{raw}' → Display name: '{data['display_name']}', Category: '{data['category']}'"
+                for raw, data in existing_mappings.items()
+            )
 
         # Format the merchants that need mapping
         merchants_to_map = "\n".join([f"- {merchant}" for merchant in merchant_batch])
-        
-        # List available categories
-        available_categories = [
-            'Food & Drinks',
-            'Transportation',
-            'Entertainment', 
-            'Education', 
-            'Shopping', 
-            'Health', 
-            'Bills', 
-            'Rent',
-            'Salary',
-            'Freelance',
-            'Investments',
-            'Side Hustle',
-            'Savings',
-            'Other'
-        ]
-        categories_list = "\n".join([f"- {category}" for category in available_categories])
+
+        categories_list = _CATEGORIES_BLOCK
 
         prompt = f"""
 I need to create consistent display names and categories for raw merchant names from bank transactions.
@@ -181,23 +305,21 @@ Important guidelines:
             Dictionary of raw_name -> {"display_name": str, "category": str}
         """
         try:
-            # Extract the text response
-            text_response = response.text
-
-            # Find and extract the JSON part
-            json_start = text_response.find("{")
-            json_end = text_response.rfind("}") + 1
-
-            if json_start == -1 or json_end == 0:
-                raise ValueError("No JSON found in response")
-
-            json_str = text_response[json_start:json_end]
-            result = json.loads(json_str)
+            # The model is constrained to application/json, so the text
+            # is the JSON document itself; no brace hunting required
+            result = json.loads(response.text)
 
             if "suggested_mappings" not in result:
                 raise ValueError("No 'suggested_mappings' field in response JSON")
 
-            return result["suggested_mappings"]
+            suggestions = result["suggested_mappings"]
+
+            # Clamp any category the model invented to 'Other'
+            for data in suggestions.values():
+                if data.get("category") not in AVAILABLE_CATEGORIES_SET:
+                    data["category"] = "Other"
+
+            return suggestions
 
         except (KeyError, json.JSONDecodeError, IndexError) as e:
             print(f"Error parsing API response: {e}")
@@ -206,25 +328,5 @@ Important guidelines:
                     for merchant in merchant_batch}
 
     def _basic_cleanup(self, merchant_name: str) -> str:
-        """
-        Basic cleanup for merchant names when API parsing fails.
-
-        Args:
-            merchant_name: Raw merchant name
-
-        Returns:
-            Basic cleaned display name
-        """
-        # Remove common prefixes
-        for prefix in ["IC*", "SQ *", "TST*"]:
-            if merchant_name.startswith(prefix):
-                merchant_name = merchant_name[len(prefix):].strip()
-
-        # Remove any trailing numbers and special characters
-        merchant_name = re.sub(r'#\d+', '', merchant_name).strip()
-        merchant_name = re.sub(r'\s+\d+', '', merchant_name).strip()
-
-        # Title case
-        merchant_name = ' '.join(word.capitalize() for word in merchant_name.lower().split())
-
-        return merchant_name
+        """Basic cleanup for merchant names when API parsing fails."""
+        return basic_cleanup(merchant_name)
@@ -0,0 +1,76 @@
+"""
+Precompiled JSON list encoders.
+
+Generates one straight-line encoder per response schema at import time,
+in the spirit of Fastify's fast-json-stringify: the key strings are
+baked into the generated code as bytes constants, so encoding a row is
+a fixed sequence of buffer appends with no per-key dispatch.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+import orjson
+from pydantic import BaseModel, ConfigDict, TypeAdapter, field_validator
+
+
+def compile_list_encoder(fields):
+    """
+    Compile an encoder for lists of dicts that share a fixed key set.
+
+    Args:
+        fields: Ordered iterable of key names present in every row
+
+    Returns:
+        A function mapping a list of row dicts to JSON bytes
+    """
+    lines = ["def _encode_row(row, _dumps=_dumps):", "    return ("]
+    for index, name in enumerate(fields):
+        prefix = '{' if index == 0 else ','
+        key_literal = f"b'{prefix}\"{name}\":'"
+        lines.append(f"        {key_literal} + _dumps(row[{name!r}]) +")
+    lines.append("        b'}'")
+    lines.append("    )")
+    namespace = {'_dumps': orjson.dumps}
+    exec('\n'.join(lines), namespace)
+    encode_row = namespace['_encode_row']
+
+    def encode_list(rows):
+        return b'[' + b','.join(map(encode_row, rows)) + b']'
+
+    return encode_list
+
+
+class TransactionOut(BaseModel):
+    """Response shape of a transaction, mirroring Transaction.to_dict()."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    amount: float
+    description: str
+    comments: Optional[str] = None
+    tags: List[str] = []
+    category: str
+    type: str
+    date: datetime
+
+    @field_validator('tags', mode='before')
+    @classmethod
+    def _tags_default(cls, value):
+        return value or []
+
+
+_transaction_list_adapter = TypeAdapter(List[TransactionOut])
+
+
+def dump_transaction_models(transactions) -> bytes:
+    """
+    Serialize a list of ORM Transaction objects straight to JSON bytes.
+
+    The whole list is validated and rendered inside pydantic's compiled
+    core, so per-row Python work is a handful of attribute reads rather
+    than a to_dict call plus dict construction per object.
+    """
+    validated = _transaction_list_adapter.validate_python(transactions)
+    return _transaction_list_adapter.dump_json(validated)